@@ -4,9 +4,14 @@ Replaces the ``claude -p`` approach with a direct API call to an LLM
 (Anthropic or OpenAI-compatible) for parameter tuning recommendations.
 """
 
+import hashlib
 import json
 import logging
 import os
+import re
+import tempfile
+import time
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -14,8 +19,20 @@ from typing import Any
 import yaml
 
 logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 _SUPPORTED_PROVIDERS: set[str] = {"anthropic", "openai"}
 
+# Opening (with optional language tag) or closing markdown fence around the whole response.
+_FENCE_RE = re.compile(r"\A```[^\n]*\n?|\n?```\Z")
+
+# Raw LLM responses keyed by a hash of everything that shapes the prompt.
+_CACHE_DIR = Path("~/.polymarket_agent/autotune_cache").expanduser()
+_CACHE_TTL: float = 3600.0
+
 _SYSTEM_PROMPT = """\
 You are an auto-tuning agent for a Polymarket trading bot.
 
@@ -88,17 +105,21 @@ def _init_client(
 
 
 def _call_llm(client: Any, provider: str, model: str, eval_json: str) -> str:
-    """Send the evaluation data to the LLM and return the raw text response."""
+    """Stream the evaluation data to the LLM and return the JSON part of its response.
+
+    The response is consumed as it arrives and the stream is closed as soon as
+    the first top-level JSON object is complete (see :func:`_first_json_object`).
+    """
     user_msg = f"EVALUATION DATA:\n{eval_json}"
 
     if provider == "anthropic":
-        response = client.messages.create(
+        with client.messages.stream(
             model=model,
             max_tokens=1024,
             system=_SYSTEM_PROMPT,
             messages=[{"role": "user", "content": user_msg}],
-        )
-        return str(response.content[0].text).strip()
+        ) as stream:
+            return _first_json_object(stream.text_stream).strip()
 
     response = client.chat.completions.create(
         model=model,
@@ -107,8 +128,88 @@ def _call_llm(client: Any, provider: str, model: str, eval_json: str) -> str:
             {"role": "system", "content": _SYSTEM_PROMPT},
             {"role": "user", "content": user_msg},
         ],
+        stream=True,
     )
-    return str(response.choices[0].message.content).strip()
+    try:
+        return _first_json_object(_openai_text_deltas(response)).strip()
+    finally:
+        response.close()
+
+
+def _openai_text_deltas(response: Iterable[Any]) -> Iterator[str]:
+    """Yield the text deltas from an OpenAI chat-completions stream."""
+    for chunk in response:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+def _first_json_object(chunks: Iterable[str]) -> str:
+    """Consume streamed text until the first top-level JSON object closes.
+
+    A single forward scan tracks brace depth and string/escape state, so
+    nothing is re-parsed while streaming and any trailing prose is never
+    waited for. Returns the object's text, or everything received if no
+    complete object appeared (which :func:`_parse_changes` will reject).
+    """
+    parts: list[str] = []
+    offset = 0
+    start = -1
+    depth = 0
+    in_string = False
+    escaped = False
+    for chunk in chunks:
+        parts.append(chunk)
+        for i, ch in enumerate(chunk):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == "{":
+                if start < 0:
+                    start = offset + i
+                depth += 1
+            elif start < 0:
+                continue
+            elif ch == '"':
+                in_string = True
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    return "".join(parts)[start : offset + i + 1]
+        offset += len(chunk)
+    return "".join(parts)
+
+
+def _cache_key(provider: str, model: str, base_url: str | None, eval_json: str) -> str:
+    """Return a stable hash of the provider, model, prompt, and evaluation payload."""
+    payload = "|".join((provider, model, base_url or "", _SYSTEM_PROMPT, eval_json))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _load_cached_response(key: str) -> str | None:
+    """Return a cached raw response if one exists and is younger than the TTL."""
+    path = _CACHE_DIR / f"{key}.txt"
+    try:
+        if time.time() - path.stat().st_mtime > _CACHE_TTL:
+            return None
+        return path.read_text()
+    except OSError:
+        return None
+
+
+def _store_cached_response(key: str, raw: str) -> None:
+    """Atomically write a raw response to the cache; failures are logged, not raised."""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(raw)
+        os.replace(tmp_name, _CACHE_DIR / f"{key}.txt")
+    except OSError:
+        logger.warning("Failed to cache autotune response in %s", _CACHE_DIR, exc_info=True)
 
 
 def _parse_changes(raw: str) -> list[dict[str, Any]]:
@@ -116,9 +217,7 @@ def _parse_changes(raw: str) -> list[dict[str, Any]]:
     # Strip markdown fences if the model wraps them
     cleaned = raw.strip()
     if cleaned.startswith("```"):
-        lines = cleaned.splitlines()
-        lines = [line for line in lines if not line.strip().startswith("```")]
-        cleaned = "\n".join(lines)
+        cleaned = _FENCE_RE.sub("", cleaned)
 
     data = json.loads(cleaned)
     if not isinstance(data, dict) or "changes" not in data:
@@ -129,7 +228,21 @@ def _parse_changes(raw: str) -> list[dict[str, Any]]:
     return changes
 
 
-def _validate_change(change: dict[str, Any], tunable: list[dict[str, object]]) -> dict[str, Any] | None:
+def _as_float(value: object, default: float) -> float:
+    """Coerce a tunable bound to float, converting numbers directly rather than via ``str()``."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if value is None:
+        return default
+    return float(str(value))
+
+
+def _index_tunable(tunable: list[Any]) -> dict[str, dict[str, object]]:
+    """Map each tunable parameter's dotted path to its spec, ignoring malformed entries."""
+    return {p["path"]: p for p in tunable if isinstance(p, dict) and isinstance(p.get("path"), str)}
+
+
+def _validate_change(change: dict[str, Any], tunable_by_path: dict[str, dict[str, object]]) -> dict[str, Any] | None:
     """Validate a single change against tunable parameter ranges.
 
     Returns the validated change dict or ``None`` if invalid.
@@ -142,8 +255,7 @@ def _validate_change(change: dict[str, Any], tunable: list[dict[str, object]]) -
         logger.warning("Skipping malformed change: %s", change)
         return None
 
-    # Find matching tunable parameter
-    param = next((p for p in tunable if p.get("path") == path), None)
+    param = tunable_by_path.get(path)
     if param is None:
         logger.warning("Skipping non-tunable parameter: %s", path)
         return None
@@ -155,8 +267,8 @@ def _validate_change(change: dict[str, Any], tunable: list[dict[str, object]]) -
         logger.warning("Skipping non-numeric value for %s: %s", path, value)
         return None
 
-    min_val = float(str(param.get("min", float("-inf"))))
-    max_val = float(str(param.get("max", float("inf"))))
+    min_val = _as_float(param.get("min"), float("-inf"))
+    max_val = _as_float(param.get("max"), float("inf"))
     if num_value < min_val or num_value > max_val:
         logger.warning("Value %s for %s out of range [%s, %s] — clamping", num_value, path, min_val, max_val)
         num_value = max(min_val, min(max_val, num_value))
@@ -172,7 +284,7 @@ def _validate_change(change: dict[str, Any], tunable: list[dict[str, object]]) -
 def _apply_changes(changes: list[dict[str, Any]], config_path: Path) -> None:
     """Apply validated changes to the config YAML file."""
     text = config_path.read_text()
-    data = yaml.safe_load(text)
+    data = yaml.load(text, Loader=_YAML_LOADER)  # noqa: S506
     if not isinstance(data, dict):
         raise ValueError(f"Config file {config_path} does not contain a YAML mapping")
 
@@ -196,7 +308,7 @@ def _apply_changes(changes: list[dict[str, Any]], config_path: Path) -> None:
 
     # Write back with a comment header
     lines = [f"# Auto-tuned on {now}\n"]
-    lines.append(yaml.dump(data, default_flow_style=False, sort_keys=False))
+    lines.append(yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False))
     config_path.write_text("".join(lines))
 
 
@@ -208,9 +320,14 @@ def run_autotune(
     model: str,
     base_url: str | None = None,
     api_key_env: str | None = None,
+    no_cache: bool = False,
 ) -> list[dict[str, Any]]:
     """Run the auto-tuning pipeline.
 
+    Responses are cached on disk for an hour, keyed by a hash of the
+    provider, model, system prompt, and evaluation payload, so re-running
+    on unchanged data does not repeat the LLM call.
+
     Args:
         eval_data: Output from the ``evaluate`` CLI command (parsed JSON).
         config_path: Path to config.yaml.
@@ -218,17 +335,27 @@ def run_autotune(
         model: Model identifier (e.g. ``"claude-sonnet-4-6"``, ``"gpt-4o"``).
         base_url: Optional API base URL for OpenAI-compatible endpoints.
         api_key_env: Optional env var name for the API key.
+        no_cache: Always call the LLM, ignoring any cached response.
 
     Returns:
         List of applied change dicts, each with ``path``, ``value``, ``reason``.
     """
     client, resolved_provider = _init_client(provider, api_key_env, base_url)
 
-    eval_json = json.dumps(eval_data, indent=2, default=str)
-    raw_response = _call_llm(client, resolved_provider, model, eval_json)
+    # Compact separators: the payload is only read by the LLM, so whitespace just costs tokens.
+    eval_json = json.dumps(eval_data, separators=(",", ":"), default=str)
+    key = _cache_key(resolved_provider, model, base_url, eval_json)
+    cached = None if no_cache else _load_cached_response(key)
+    if cached is not None:
+        logger.info("Using cached LLM response")
+        raw_response = cached
+    else:
+        raw_response = _call_llm(client, resolved_provider, model, eval_json)
     logger.info("LLM response: %s", raw_response)
 
     changes = _parse_changes(raw_response)
+    if cached is None:
+        _store_cached_response(key, raw_response)
     if not changes:
         logger.info("No changes recommended")
         return []
@@ -237,9 +364,10 @@ def run_autotune(
     if not isinstance(tunable, list):
         tunable = []
 
+    tunable_by_path = _index_tunable(tunable)
     validated: list[dict[str, Any]] = []
     for change in changes:
-        result = _validate_change(change, tunable)
+        result = _validate_change(change, tunable_by_path)
         if result is not None:
             validated.append(result)
 
@@ -1 +1,5 @@
 """Backtesting framework for historical data replay."""
+
+# CSV files above this size are parsed in batches of about this many bytes.
+# Kept here, free of heavy imports, so the CLI can use it as its option default.
+DEFAULT_CHUNK_BYTES = 256 * 1024 * 1024
@@ -1,9 +1,6 @@
 """Backtest engine — replays historical data through strategies and execution."""
 
 import logging
-import tempfile
-from dataclasses import asdict
-from pathlib import Path
 from typing import Any
 
 from polymarket_agent.backtest.historical import HistoricalDataProvider
@@ -17,6 +14,21 @@ from polymarket_agent.strategies.base import Signal, Strategy
 logger = logging.getLogger(__name__)
 
 
+def build_strategies(config: AppConfig) -> list[Strategy]:
+    """Instantiate and configure the enabled strategies in *config*, skipping unknown names."""
+    from polymarket_agent.orchestrator import STRATEGY_REGISTRY  # noqa: PLC0415
+
+    strategies: list[Strategy] = []
+    for name, params in config.enabled_strategies.items():
+        cls = STRATEGY_REGISTRY.get(name)
+        if cls is None:
+            continue
+        instance = cls()
+        instance.configure(params)
+        strategies.append(instance)
+    return strategies
+
+
 class BacktestEngine:
     """Replays historical market data through strategies and paper execution.
 
@@ -71,44 +83,48 @@ class BacktestEngine:
                 trades=[],
             )
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            db_path = Path(tmp_dir) / "backtest.db"
-            db = Database(db_path)
+        # The trade log only lives for this run, so keep it in memory rather than on disk.
+        with Database(":memory:") as db:
             executor = PaperTrader(starting_balance=self._config.starting_balance, db=db)
 
             snapshots: list[PortfolioSnapshot] = []
-            for ts in timestamps:
-                self._provider.advance(ts)
-                markets = self._provider.get_active_markets()
-
-                raw_signals: list[Signal] = []
-                for strategy in self._strategies:
-                    try:
-                        raw_signals.extend(strategy.analyze(markets, self._provider))
-                    except Exception:
-                        logger.exception("Strategy %s failed at %s", getattr(strategy, "name", "?"), ts)
-
-                signals = aggregate_signals(
-                    raw_signals,
-                    min_confidence=self._config.aggregation.min_confidence,
-                    min_strategies=self._config.aggregation.min_strategies,
-                )
-
-                for signal in signals:
-                    executor.place_order(signal)
-
-                portfolio = executor.get_portfolio()
-                snapshots.append(
-                    PortfolioSnapshot(
-                        timestamp=ts,
-                        balance=portfolio.balance,
-                        total_value=portfolio.total_value,
+            # Loop invariants, bound once instead of re-resolved on every tick.
+            provider = self._provider
+            strategies = self._strategies
+            min_confidence = self._config.aggregation.min_confidence
+            min_strategies = self._config.aggregation.min_strategies
+            with db.bulk_transaction():
+                for ts in timestamps:
+                    provider.advance(ts)
+                    markets = provider.get_active_markets()
+
+                    raw_signals: list[Signal] = []
+                    for strategy in strategies:
+                        try:
+                            raw_signals.extend(strategy.analyze(markets, provider))
+                        except Exception:
+                            logger.exception("Strategy %s failed at %s", getattr(strategy, "name", "?"), ts)
+
+                    signals = aggregate_signals(
+                        raw_signals,
+                        min_confidence=min_confidence,
+                        min_strategies=min_strategies,
+                    )
+
+                    for signal in signals:
+                        executor.place_order(signal)
+
+                    portfolio = executor.get_portfolio()
+                    snapshots.append(
+                        PortfolioSnapshot(
+                            timestamp=ts,
+                            balance=portfolio.balance,
+                            total_value=portfolio.total_value,
+                        )
                     )
-                )
 
             trades = db.get_trades()
             metrics = compute_metrics(trades, snapshots, self._config.starting_balance)
-            db.close()
 
         return BacktestResult(metrics=metrics, snapshots=snapshots, trades=trades)
 
@@ -128,8 +144,20 @@ class BacktestResult:
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize the result to a JSON-friendly dict."""
+        # Snapshots and metrics are flat, so build the dicts directly instead of
+        # paying for asdict()'s recursive deep copy on every snapshot.
+        m = self.metrics
         return {
-            "metrics": asdict(self.metrics),
-            "snapshots": [asdict(s) for s in self.snapshots],
+            "metrics": {
+                "total_return": m.total_return,
+                "sharpe_ratio": m.sharpe_ratio,
+                "max_drawdown": m.max_drawdown,
+                "win_rate": m.win_rate,
+                "profit_factor": m.profit_factor,
+                "total_trades": m.total_trades,
+            },
+            "snapshots": [
+                {"timestamp": s.timestamp, "balance": s.balance, "total_value": s.total_value} for s in self.snapshots
+            ],
             "total_trades": len(self.trades),
         }
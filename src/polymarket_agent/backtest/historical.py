@@ -6,25 +6,166 @@ DataProvider interface used by the live CLI wrapper.
 
 import csv
 import logging
-from dataclasses import dataclass
+import os
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
+import numpy as np
+from numpy.typing import NDArray
+
+from polymarket_agent.backtest import DEFAULT_CHUNK_BYTES
 from polymarket_agent.data.models import Market, OrderBook, OrderBookLevel, PricePoint, Spread, Trader
 
 logger = logging.getLogger(__name__)
 
+# Below this many files a process pool costs more to start than it saves.
+_PARALLEL_MIN_FILES = 4
+
+_CSV_COLUMNS = ("timestamp", "market_id", "question", "yes_price", "volume", "token_id")
+
+
+class _CsvColumns(NamedTuple):
+    """Column-wise contents of one parsed CSV file."""
+
+    timestamps: list[str]
+    market_ids: list[str]
+    questions: list[str]
+    yes_prices: NDArray[np.float64]
+    volumes: NDArray[np.float64]
+    token_ids: list[str]
+
+
+def _is_float(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _bulk_numeric(
+    rows: list[list[str]], width: int, price_col: int, vol_col: int
+) -> tuple[NDArray[np.float64], NDArray[np.float64]] | None:
+    """Convert the price and volume columns in one NumPy call, or ``None`` if any row is malformed."""
+    if any(len(row) < width for row in rows):
+        return None
+    try:
+        yes_prices = np.array([row[price_col] for row in rows], dtype=np.float64)
+        volumes = np.array([row[vol_col] for row in rows], dtype=np.float64)
+    except ValueError:
+        return None
+    return yes_prices, volumes
+
+
+def _read_csv_columns(csv_file: Path, chunk_bytes: int = 0) -> _CsvColumns | None:
+    """Parse a CSV file column-wise, skipping malformed rows.
 
-@dataclass
-class _TimeStep:
-    """A single observation of a market at a point in time."""
+    Rows are transposed into columns in one step and the numeric columns are
+    converted in bulk by NumPy; the per-row validation pass only runs when the
+    bulk conversion finds a bad value. Files larger than a positive
+    *chunk_bytes* are streamed instead, see :func:`_read_csv_batched`.
+    """
+    if 0 < chunk_bytes < csv_file.stat().st_size:
+        return _read_csv_batched(csv_file, chunk_bytes)
+    # utf-8-sig strips a BOM from the header; the reader streams the buffered file
+    # rather than holding the whole decoded text alongside the row lists
+    with csv_file.open(encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        layout = _column_layout(csv_file, next(reader, None))
+        if layout is None:
+            return None
+        rows = [row for row in reader if row]
+    return _rows_to_columns(csv_file, rows, layout)
+
+
+def _read_csv_batched(csv_file: Path, chunk_bytes: int) -> _CsvColumns | None:
+    """Parse a large CSV file in batches of roughly *chunk_bytes* of input.
+
+    Each batch is converted to compact columns before the next one is read, so
+    only one batch of per-row string lists is alive at a time rather than the
+    whole decoded file plus a list for every row.
+    """
+    consumed = 0
+
+    def counted(lines: Iterable[str]) -> Iterator[str]:
+        nonlocal consumed
+        for line in lines:
+            consumed += len(line)
+            yield line
+
+    with csv_file.open(encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(counted(f))
+        layout = _column_layout(csv_file, next(reader, None))
+        if layout is None:
+            return None
+        batches: list[_CsvColumns] = []
+        rows: list[list[str]] = []
+        for row in reader:
+            if row:
+                rows.append(row)
+            if consumed >= chunk_bytes:
+                batches.append(_rows_to_columns(csv_file, rows, layout))
+                rows, consumed = [], 0
+        if rows or not batches:
+            batches.append(_rows_to_columns(csv_file, rows, layout))
+    return _CsvColumns(
+        timestamps=[ts for batch in batches for ts in batch.timestamps],
+        market_ids=[market_id for batch in batches for market_id in batch.market_ids],
+        questions=[question for batch in batches for question in batch.questions],
+        yes_prices=np.concatenate([batch.yes_prices for batch in batches]),
+        volumes=np.concatenate([batch.volumes for batch in batches]),
+        token_ids=[token_id for batch in batches for token_id in batch.token_ids],
+    )
+
+
+def _column_layout(csv_file: Path, header: list[str] | None) -> tuple[int, ...] | None:
+    """Return the positions of :data:`_CSV_COLUMNS` in *header*, or ``None`` if any is missing."""
+    if header is None:
+        return None
+    try:
+        return tuple(header.index(name) for name in _CSV_COLUMNS)
+    except ValueError:
+        logger.warning("Skipping %s: expected columns %s", csv_file, ", ".join(_CSV_COLUMNS))
+        return None
 
-    timestamp: str
-    market_id: str
-    question: str
-    yes_price: float
-    volume: float
-    token_id: str
+
+def _rows_to_columns(csv_file: Path, rows: list[list[str]], layout: tuple[int, ...]) -> _CsvColumns:
+    """Transpose parsed CSV rows into columns, dropping malformed rows."""
+    ts_col, mid_col, q_col, price_col, vol_col, tok_col = layout
+    width = max(layout) + 1
+    numeric = _bulk_numeric(rows, width, price_col, vol_col)
+    if numeric is None:
+        valid: list[list[str]] = []
+        for row in rows:
+            if len(row) >= width and _is_float(row[price_col]) and _is_float(row[vol_col]):
+                valid.append(row)
+            else:
+                logger.warning("Skipping malformed CSV row in %s: %s", csv_file, row)
+        rows = valid
+        numeric = (
+            np.array([float(row[price_col]) for row in rows], dtype=np.float64),
+            np.array([float(row[vol_col]) for row in rows], dtype=np.float64),
+        )
+    yes_prices, volumes = numeric
+
+    # Every field below repeats once per timestamp; interning collapses the
+    # copies csv.reader allocates into one shared str per distinct value, which
+    # keeps the object columns small and lets equality short-circuit on identity.
+    intern = sys.intern
+    return _CsvColumns(
+        timestamps=[intern(row[ts_col]) for row in rows],
+        market_ids=[intern(row[mid_col]) for row in rows],
+        questions=[intern(row[q_col]) for row in rows],
+        yes_prices=yes_prices,
+        volumes=volumes,
+        token_ids=[intern(row[tok_col]) for row in rows],
+    )
 
 
 class HistoricalDataProvider:
@@ -35,16 +176,31 @@ class HistoricalDataProvider:
     The provider maintains a time cursor that controls which rows are
     visible to callers. Call :meth:`advance` to move forward in time.
 
+    Rows are stored column-wise (one NumPy array per CSV column, sorted by
+    timestamp) so cursor lookups are vectorized scans over contiguous data.
+
     Args:
         data_dir: Directory containing CSV files.
         default_spread: Synthetic spread applied around the price to build
             an orderbook (half on each side).
+        chunk_bytes: CSV files larger than this are parsed in batches of
+            roughly this size to bound peak memory while loading; ``0`` reads
+            every file in one pass.
     """
 
-    def __init__(self, data_dir: Path, *, default_spread: float = 0.02) -> None:
+    def __init__(self, data_dir: Path, *, default_spread: float = 0.02, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> None:
         self._default_spread = default_spread
-        self._steps: list[_TimeStep] = []
-        self._timestamps: list[str] = []
+        self._chunk_bytes = chunk_bytes
+        self._timestamps: NDArray[np.object_] = np.empty(0, dtype=object)
+        self._market_ids: NDArray[np.object_] = np.empty(0, dtype=object)
+        self._questions: NDArray[np.object_] = np.empty(0, dtype=object)
+        self._yes_prices: NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        self._volumes: NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        self._token_ids: NDArray[np.object_] = np.empty(0, dtype=object)
+        self._rows_by_token: dict[str, NDArray[np.intp]] = {}
+        self._unique_timestamps: list[str] = []
+        self._ts_ranges: dict[str, tuple[int, int]] = {}
+        self._markets_by_cursor: dict[int, dict[str, Market]] = {}
         self._cursor: int = 0
         self._load_csv_files(data_dir)
 
@@ -54,21 +210,11 @@ class HistoricalDataProvider:
 
     def get_active_markets(self, *, tag: str | None = None, limit: int = 50) -> list[Market]:
         """Return markets visible at the current time step."""
-        current = self._current_steps()
-        seen: dict[str, _TimeStep] = {}
-        for step in current:
-            seen[step.market_id] = step
-        markets: list[Market] = []
-        for step in list(seen.values())[:limit]:
-            markets.append(self._step_to_market(step))
-        return markets
+        return list(self._current_markets().values())[:limit]
 
     def get_market(self, market_id: str) -> Market | None:
         """Return a market by ID from current time step, or None if not found."""
-        for step in reversed(self._current_steps()):
-            if step.market_id == market_id:
-                return self._step_to_market(step)
-        return None
+        return self._current_markets().get(market_id)
 
     def get_orderbook(self, token_id: str) -> OrderBook:
         """Synthesize an orderbook from the current price for a token."""
@@ -97,11 +243,11 @@ class HistoricalDataProvider:
         fidelity: int = 60,
     ) -> list[PricePoint]:
         """Return all historical price points up to the current cursor for a token."""
-        points: list[PricePoint] = []
-        for step in self._steps[: self._cursor + 1]:
-            if step.token_id == token_id:
-                points.append(PricePoint(timestamp=step.timestamp, price=step.yes_price))
-        return points
+        rows = self._visible_token_rows(token_id)
+        return [
+            PricePoint(timestamp=ts, price=price)
+            for ts, price in zip(self._timestamps[rows].tolist(), self._yes_prices[rows].tolist(), strict=True)
+        ]
 
     def get_leaderboard(self, *, period: str = "month") -> list[Trader]:
         """Not available in backtesting — returns empty list."""
@@ -120,92 +266,134 @@ class HistoricalDataProvider:
 
         All rows with ``timestamp <= target`` become visible.
         """
-        for i, ts in enumerate(self._timestamps):
-            if ts > timestamp:
-                self._cursor = max(i - 1, 0)
-                return
-        self._cursor = len(self._timestamps) - 1
+        bounds = self._ts_ranges.get(timestamp)
+        if bounds is not None:
+            self._cursor = bounds[1] - 1
+            return
+        # Between data points: land on the last timestamp at or before the target.
+        i = bisect_right(self._unique_timestamps, timestamp)
+        self._cursor = self._ts_ranges[self._unique_timestamps[i - 1]][1] - 1 if i > 0 else 0
 
     @property
     def current_timestamp(self) -> str:
         """Return the timestamp at the current cursor position."""
-        if not self._timestamps:
+        if self._timestamps.size == 0:
             return ""
-        return self._timestamps[self._cursor]
+        return str(self._timestamps[self._cursor])
 
     @property
     def unique_timestamps(self) -> list[str]:
         """Return the sorted unique timestamps available for stepping."""
-        seen: list[str] = []
-        prev = ""
-        for ts in self._timestamps:
-            if ts != prev:
-                seen.append(ts)
-                prev = ts
-        return seen
+        return self._unique_timestamps
 
     @property
     def total_steps(self) -> int:
         """Return the number of raw data rows loaded."""
-        return len(self._steps)
+        return int(self._timestamps.size)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _load_csv_files(self, data_dir: Path) -> None:
-        """Load all CSV files in the directory, sorted by timestamp."""
+        """Load all CSV files in the directory into timestamp-sorted columns."""
         csv_files = sorted(data_dir.glob("*.csv"))
         if not csv_files:
             logger.warning("No CSV files found in %s", data_dir)
             return
 
-        for csv_file in csv_files:
-            with csv_file.open(newline="") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    try:
-                        step = _TimeStep(
-                            timestamp=row["timestamp"],
-                            market_id=row["market_id"],
-                            question=row["question"],
-                            yes_price=float(row["yes_price"]),
-                            volume=float(row["volume"]),
-                            token_id=row["token_id"],
-                        )
-                        self._steps.append(step)
-                    except (KeyError, ValueError):
-                        logger.warning("Skipping malformed CSV row in %s: %s", csv_file, row)
-
-        self._steps.sort(key=lambda s: s.timestamp)
-        self._timestamps = [s.timestamp for s in self._steps]
-        logger.info("Loaded %d rows from %d CSV files", len(self._steps), len(csv_files))
-
-    def _current_steps(self) -> list[_TimeStep]:
-        """Return all steps at the current timestamp."""
-        if not self._timestamps:
-            return []
-        target_ts = self._timestamps[self._cursor]
-        return [s for s in self._steps[: self._cursor + 1] if s.timestamp == target_ts]
+        read = partial(_read_csv_columns, chunk_bytes=self._chunk_bytes)
+        if len(csv_files) >= _PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=min(len(csv_files), os.cpu_count() or 1)) as pool:
+                results = list(pool.map(read, csv_files))
+        else:
+            results = [read(csv_file) for csv_file in csv_files]
+        parsed = [columns for columns in results if columns is not None]
+        # Strings unpickled from worker processes are no longer interned here,
+        # so re-intern while concatenating (a cheap lookup for in-process ones).
+        intern = sys.intern
+        timestamps = [intern(ts) for columns in parsed for ts in columns.timestamps]
+        market_ids = [intern(market_id) for columns in parsed for market_id in columns.market_ids]
+        questions = [intern(question) for columns in parsed for question in columns.questions]
+        token_ids = [intern(token_id) for columns in parsed for token_id in columns.token_ids]
+        yes_prices = np.concatenate([columns.yes_prices for columns in parsed]) if parsed else np.empty(0)
+        volumes = np.concatenate([columns.volumes for columns in parsed]) if parsed else np.empty(0)
+
+        ts_column = np.array(timestamps, dtype=object)
+        order = np.argsort(ts_column, kind="stable")
+        self._timestamps = ts_column[order]
+        self._market_ids = np.array(market_ids, dtype=object)[order]
+        self._questions = np.array(questions, dtype=object)[order]
+        self._yes_prices = yes_prices[order]
+        self._volumes = volumes[order]
+        self._token_ids = np.array(token_ids, dtype=object)[order]
+        self._build_token_index()
+        self._build_timestamp_ranges()
+        logger.info("Loaded %d rows from %d CSV files", self._timestamps.size, len(csv_files))
+
+    def _build_token_index(self) -> None:
+        """Index the (ascending) row positions of every token for binary-searched lookups."""
+        by_token: defaultdict[str, list[int]] = defaultdict(list)
+        for row, token_id in enumerate(self._token_ids.tolist()):
+            by_token[token_id].append(row)
+        self._rows_by_token = {token_id: np.array(rows, dtype=np.intp) for token_id, rows in by_token.items()}
+
+    def _build_timestamp_ranges(self) -> None:
+        """Record the ``[start, end)`` row range of every distinct timestamp."""
+        if self._timestamps.size == 0:
+            return
+        unique, starts = np.unique(self._timestamps, return_index=True)
+        ends = [*starts[1:].tolist(), int(self._timestamps.size)]
+        self._unique_timestamps = unique.tolist()
+        self._ts_ranges = dict(zip(self._unique_timestamps, zip(starts.tolist(), ends, strict=True), strict=True))
+
+    def _visible_token_rows(self, token_id: str) -> NDArray[np.intp]:
+        """Return the row indices for a token at or before the cursor."""
+        rows = self._rows_by_token.get(token_id)
+        if rows is None:
+            return np.empty(0, dtype=np.intp)
+        return rows[: int(np.searchsorted(rows, self._cursor, side="right"))]
+
+    def _current_rows(self) -> NDArray[np.intp]:
+        """Return the row indices of all observations at the current timestamp."""
+        if self._timestamps.size == 0:
+            return np.empty(0, dtype=np.intp)
+        start, _ = self._ts_ranges[self._timestamps[self._cursor]]
+        return np.arange(start, self._cursor + 1, dtype=np.intp)
+
+    def _current_markets(self) -> dict[str, Market]:
+        """Return the latest Market per market ID at the cursor, memoized per cursor position.
+
+        Rows never change after load, so each time step's markets are built at
+        most once no matter how often strategies ask for them.
+        """
+        markets = self._markets_by_cursor.get(self._cursor)
+        if markets is None:
+            latest: dict[str, int] = {}
+            for row in self._current_rows().tolist():
+                latest[self._market_ids[row]] = row
+            markets = {market_id: self._row_to_market(row) for market_id, row in latest.items()}
+            self._markets_by_cursor[self._cursor] = markets
+        return markets
 
     def _current_price(self, token_id: str) -> float:
         """Return the most recent price for a token at or before the cursor."""
-        for step in reversed(self._steps[: self._cursor + 1]):
-            if step.token_id == token_id:
-                return step.yes_price
-        msg = f"No price data for token {token_id} at cursor {self._cursor}"
-        raise RuntimeError(msg)
-
-    @staticmethod
-    def _step_to_market(step: _TimeStep) -> Market:
-        """Convert a time step row to a Market model."""
+        rows = self._visible_token_rows(token_id)
+        if rows.size == 0:
+            msg = f"No price data for token {token_id} at cursor {self._cursor}"
+            raise RuntimeError(msg)
+        return float(self._yes_prices[rows[-1]])
+
+    def _row_to_market(self, row: int) -> Market:
+        """Convert a data row to a Market model."""
+        yes_price = float(self._yes_prices[row])
         return Market(
-            id=step.market_id,
-            question=step.question,
+            id=self._market_ids[row],
+            question=self._questions[row],
             outcomes=["Yes", "No"],
-            outcome_prices=[step.yes_price, round(1.0 - step.yes_price, 4)],
-            volume=step.volume,
+            outcome_prices=[yes_price, round(1.0 - yes_price, 4)],
+            volume=float(self._volumes[row]),
             active=True,
             closed=False,
-            clob_token_ids=[step.token_id],
+            clob_token_ids=[self._token_ids[row]],
         )
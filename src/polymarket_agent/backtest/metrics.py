@@ -1,11 +1,15 @@
 """Performance metrics for backtest results."""
 
 import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
+from numpy.typing import NDArray
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PortfolioSnapshot:
     """A point-in-time snapshot of portfolio value."""
 
@@ -14,7 +18,7 @@ class PortfolioSnapshot:
     total_value: float
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestMetrics:
     """Aggregate performance metrics from a backtest run."""
 
@@ -38,9 +42,30 @@ def compute_metrics(
         snapshots: Chronological portfolio snapshots.
         initial_balance: Starting balance to compute total return.
     """
-    total_return = _compute_total_return(snapshots, initial_balance)
-    sharpe_ratio = _compute_sharpe_ratio(snapshots)
-    max_drawdown = _compute_max_drawdown(snapshots)
+    values = np.fromiter((s.total_value for s in snapshots), dtype=np.float64, count=len(snapshots))
+    return compute_metrics_arrays(trades, [s.timestamp for s in snapshots], values, initial_balance)
+
+
+def compute_metrics_arrays(
+    trades: list[dict[str, object]],
+    timestamps: Sequence[str],
+    values: NDArray[np.float64],
+    initial_balance: float,
+) -> BacktestMetrics:
+    """Compute the same metrics as :func:`compute_metrics` from column arrays.
+
+    Callers holding raw database rows can pass the timestamp and total-value
+    columns directly instead of first building a ``PortfolioSnapshot`` per row.
+
+    Args:
+        trades: List of trade dicts from the database (must contain 'side', 'price', 'size').
+        timestamps: Chronological snapshot timestamps (ISO strings).
+        values: Portfolio total values aligned with *timestamps*.
+        initial_balance: Starting balance to compute total return.
+    """
+    total_return, period_sharpe, max_drawdown = _reduce_values(values, initial_balance)
+    # Annualize with the actual snapshot frequency rather than a hardcoded sqrt(252).
+    sharpe_ratio = period_sharpe * math.sqrt(_estimate_periods_per_year(timestamps)) if period_sharpe else 0.0
     win_rate, profit_factor = _compute_trade_stats(trades)
 
     return BacktestMetrics(
@@ -53,57 +78,65 @@ def compute_metrics(
     )
 
 
-def _compute_total_return(snapshots: list[PortfolioSnapshot], initial_balance: float) -> float:
-    """Total return as a fraction (e.g. 0.10 = 10%)."""
-    if not snapshots or initial_balance <= 0:
-        return 0.0
-    final_value = snapshots[-1].total_value
-    return (final_value - initial_balance) / initial_balance
-
+def _reduce_values(values: NDArray[np.float64], initial_balance: float) -> tuple[float, float, float]:
+    """Reduce a chronological portfolio-value series to its return statistics.
 
-def _compute_sharpe_ratio(snapshots: list[PortfolioSnapshot]) -> float:
-    """Annualized Sharpe ratio from portfolio snapshots. Assumes risk-free rate of 0.
+    All three statistics are derived from the one value array, sharing the
+    lagged view and period-over-period deltas instead of re-walking the
+    snapshots per metric.
 
-    Computes actual periods per year from snapshot timestamps rather than
-    hardcoding sqrt(252) to handle variable snapshot frequencies correctly.
+    Returns:
+        ``(total_return, per_period_sharpe, max_drawdown)`` where total return
+        and drawdown are fractions (0.10 = 10%) and the Sharpe ratio is not yet
+        annualized (risk-free rate of 0). Degenerate inputs yield 0.0.
     """
-    if len(snapshots) < 2:
-        return 0.0
-    values = [s.total_value for s in snapshots]
-    returns: list[float] = []
-    for i in range(1, len(values)):
-        if values[i - 1] > 0:
-            returns.append((values[i] - values[i - 1]) / values[i - 1])
-    if not returns or len(returns) < 2:
-        return 0.0
-    mean = sum(returns) / len(returns)
-    variance = sum((r - mean) ** 2 for r in returns) / (len(returns) - 1)
-    std = math.sqrt(variance)
-    if std == 0:
-        return 0.0
-
-    # Compute annualization factor from actual snapshot timestamps
-    periods_per_year = _estimate_periods_per_year(snapshots)
-    return (mean / std) * math.sqrt(periods_per_year)
-
-
-def _estimate_periods_per_year(snapshots: list[PortfolioSnapshot]) -> float:
+    if values.size == 0:
+        return 0.0, 0.0, 0.0
+
+    total_return = float((values[-1] - initial_balance) / initial_balance) if initial_balance > 0 else 0.0
+
+    peak = np.maximum.accumulate(values)
+    drawdowns = np.divide(peak - values, peak, out=np.zeros_like(values), where=peak > 0)
+    max_drawdown = max(float(drawdowns.max()), 0.0)
+
+    prev = values[:-1]
+    valid = prev > 0
+    returns = np.diff(values)[valid] / prev[valid]
+    period_sharpe = 0.0
+    if returns.size >= 2:
+        # One mean pass, then the centred sum of squares as a single dot product;
+        # ndarray.std() would recompute the mean internally.
+        mean = float(returns.mean())
+        deviations = returns - mean
+        variance = float(deviations @ deviations) / (returns.size - 1)
+        if variance > 0:
+            period_sharpe = mean / math.sqrt(variance)
+
+    return total_return, period_sharpe, max_drawdown
+
+
+def _estimate_periods_per_year(stamps: Sequence[str]) -> float:
     """Estimate periods per year from snapshot timestamp spacing.
 
     Parses ISO timestamps and computes the average interval between snapshots,
     then derives how many such intervals fit in a year. Falls back to 252
     (daily trading days) if timestamps can't be parsed.
     """
-    if len(snapshots) < 2:
+    if len(stamps) < 2:
         return 252.0
 
-    timestamps: list[datetime] = []
-    for s in snapshots:
-        try:
-            ts = datetime.fromisoformat(s.timestamp.replace("Z", "+00:00"))
-            timestamps.append(ts)
-        except (ValueError, AttributeError):
-            continue
+    try:
+        # Common case: every timestamp is valid ISO (fromisoformat reads a "Z" suffix
+        # itself), so parse them all in one C-level map with no per-row try/append.
+        timestamps = list(map(datetime.fromisoformat, stamps))
+    except (ValueError, TypeError):
+        timestamps = []
+        for stamp in stamps:
+            try:
+                ts = datetime.fromisoformat(stamp.replace("Z", "+00:00"))
+                timestamps.append(ts)
+            except (ValueError, AttributeError):
+                continue
 
     if len(timestamps) < 2:
         return 252.0
@@ -118,21 +151,6 @@ def _estimate_periods_per_year(snapshots: list[PortfolioSnapshot]) -> float:
     return seconds_per_year / avg_interval_seconds
 
 
-def _compute_max_drawdown(snapshots: list[PortfolioSnapshot]) -> float:
-    """Maximum drawdown as a positive fraction (e.g. 0.15 = 15% drawdown)."""
-    if not snapshots:
-        return 0.0
-    peak = snapshots[0].total_value
-    max_dd = 0.0
-    for s in snapshots:
-        if s.total_value > peak:
-            peak = s.total_value
-        if peak > 0:
-            dd = (peak - s.total_value) / peak
-            max_dd = max(max_dd, dd)
-    return max_dd
-
-
 def _compute_trade_stats(trades: list[dict[str, object]]) -> tuple[float, float]:
     """Return (win_rate, profit_factor) from trade records.
 
@@ -157,7 +175,8 @@ def _compute_trade_stats(trades: list[dict[str, object]]) -> tuple[float, float]
     for trade in trades:
         side = str(trade.get("side", ""))
         token_id = str(trade.get("token_id", ""))
-        price = float(str(trade.get("price", 0)))
+        raw_price = trade.get("price") or 0.0
+        price = float(raw_price) if isinstance(raw_price, (int, float)) else float(str(raw_price))
 
         if side == "buy":
             buy_prices[token_id] = price
@@ -1,5 +1,6 @@
 """Configuration loading and validation."""
 
+import logging
 from pathlib import Path
 from typing import Any, Literal
 
@@ -7,6 +8,14 @@ import yaml
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
+logger = logging.getLogger(__name__)
+
+# libyaml's C loader parses several times faster than the pure-Python SafeLoader
+# and accepts the same safe subset of YAML.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+if _YAML_LOADER is yaml.SafeLoader:
+    logger.warning("PyYAML was built without libyaml; config loading falls back to the pure-Python SafeLoader")
+
 
 class RiskConfig(BaseModel):
     """Risk management configuration."""
@@ -131,11 +140,17 @@ class AppConfig(BaseModel):
     news: NewsConfig = Field(default_factory=NewsConfig)
     focus: FocusConfig = Field(default_factory=FocusConfig)
 
+    @property
+    def enabled_strategies(self) -> dict[str, dict[str, Any]]:
+        """Return the ``strategies`` entries whose ``enabled`` flag is set."""
+        return {name: params for name, params in self.strategies.items() if params.get("enabled", False)}
+
 
 def load_config(path: Path) -> AppConfig:
     """Load config from a YAML file."""
     load_dotenv(path.parent / ".env", override=False)
-    return AppConfig(**yaml.safe_load(path.read_text()))
+    # Hand libyaml raw bytes so UTF-8 decoding happens in C as well
+    return AppConfig(**yaml.load(path.read_bytes(), Loader=_YAML_LOADER))  # noqa: S506
 
 
 def config_mtime(path: Path) -> float:
@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
+import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, TypedDict
 
+from pydantic_core import to_json
+
 from polymarket_agent import __version__
 from polymarket_agent.db import Database
 from polymarket_agent.execution.base import Portfolio
 
 _STATIC_DIR = Path(__file__).parent / "static"
 
+_JSON_SCALAR_TYPES = frozenset({int, float, bool, str, type(None)})
+
+# Distinct (route, params) responses kept per database state
+_DB_RESPONSES_MAX = 64
+
+# Set by ``polymarket-agent dashboard --workers N`` for build_app_factory().
+CONFIG_PATH_ENV = "POLYMARKET_AGENT_DASHBOARD_CONFIG"
+DB_PATH_ENV = "POLYMARKET_AGENT_DASHBOARD_DB"
+
 
 class StrategyStats(TypedDict):
     trade_count: int
@@ -31,50 +46,124 @@ def create_app(db: Database, get_portfolio: Any, get_recent_trades: Any) -> Any:
     Returns:
         A FastAPI application instance.
     """
-    from fastapi import FastAPI  # noqa: PLC0415
-    from fastapi.responses import FileResponse, JSONResponse  # noqa: PLC0415
+    from fastapi import FastAPI, Header  # noqa: PLC0415
+    from fastapi.responses import JSONResponse, Response  # noqa: PLC0415
 
-    app = FastAPI(title="Polymarket Agent Dashboard", version=__version__)
+    class FastJSONResponse(JSONResponse):
+        """``JSONResponse`` rendered by :func:`_json_bytes` instead of the stdlib encoder."""
 
+        def render(self, content: Any) -> bytes:
+            return _json_bytes(content)
+
+    app = FastAPI(title="Polymarket Agent Dashboard", version=__version__, default_response_class=FastJSONResponse)
+
+    # Handlers that only touch memory are ``async def`` so they answer on the
+    # event loop without a threadpool hop. Anything that reads SQLite or asks
+    # the executor (the live trader calls the CLOB API) stays ``def`` and
+    # runs in FastAPI's threadpool, which is what asyncio.to_thread would do.
     @app.get("/api/health")
-    def api_health() -> JSONResponse:
-        return JSONResponse({"status": "ok", "version": __version__})
+    async def api_health() -> JSONResponse:
+        return FastJSONResponse({"status": "ok", "version": __version__})
+
+    # (balance, positions) -> (body, ETag) of the last /api/portfolio response.
+    # Dashboards poll far more often than the portfolio changes, so an
+    # unchanged portfolio is answered from these bytes (or with a 304).
+    portfolio_cache: tuple[tuple[float, dict[str, dict[str, Any]]], bytes, str] | None = None
 
     @app.get("/api/portfolio")
-    def api_portfolio() -> JSONResponse:
+    def api_portfolio(if_none_match: str | None = Header(default=None)) -> Response:  # noqa: B008
+        nonlocal portfolio_cache
         portfolio: Portfolio = get_portfolio()
-        return JSONResponse(
-            {
-                "balance": portfolio.balance,
-                "total_value": portfolio.total_value,
-                "positions": portfolio.positions,
-            }
-        )
+        cached = portfolio_cache
+        if cached is None or cached[0] != (portfolio.balance, portfolio.positions):
+            body = _dumps(
+                {
+                    "balance": portfolio.balance,
+                    "total_value": portfolio.total_value,
+                    "positions": portfolio.positions,
+                }
+            ).encode()
+            etag = _weak_etag(body)
+            # Executors share the inner position dicts and update them in place,
+            # so the key must be a deep copy to notice the next change.
+            cached = ((portfolio.balance, copy.deepcopy(portfolio.positions)), body, etag)
+            portfolio_cache = cached
+        _, body, etag = cached
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(body, media_type="application/json", headers={"ETag": etag})
 
     @app.get("/api/trades")
     def api_trades(limit: int = 50) -> JSONResponse:
         trades = get_recent_trades(limit=limit)
-        return JSONResponse(trades)
+        return FastJSONResponse(trades)
+
+    # Route key -> (body, headers) of responses built from the database, all
+    # dropped as soon as Database.data_stamp() moves. Polls between writes then
+    # skip the query and the encoding, or get a 304 for a matching ETag.
+    db_responses: dict[tuple[object, ...], tuple[bytes, dict[str, str]]] = {}
+    db_responses_stamp: tuple[int, int] | None = None
+
+    def db_response(
+        key: tuple[object, ...], build: Callable[[], tuple[bytes, dict[str, str]]], if_none_match: str | None
+    ) -> Response:
+        nonlocal db_responses, db_responses_stamp
+        stamp = db.data_stamp()
+        if stamp != db_responses_stamp or len(db_responses) >= _DB_RESPONSES_MAX:
+            db_responses = {}
+            db_responses_stamp = stamp
+        # Bind the dict for this stamp: if a concurrent poll sees a newer stamp
+        # while this one builds, the result lands in the discarded dict.
+        responses = db_responses
+        entry = responses.get(key)
+        if entry is None:
+            body, headers = build()
+            entry = (body, {**headers, "ETag": _weak_etag(body)})
+            responses[key] = entry
+        body, headers = entry
+        if if_none_match == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
 
     @app.get("/api/signals")
-    def api_signals(strategy: str | None = None, limit: int = 100) -> JSONResponse:
-        signals = db.get_signal_log(strategy=strategy, limit=limit)
-        return JSONResponse([_serialize_row(s) for s in signals])
+    def api_signals(
+        strategy: str | None = None,
+        limit: int = 100,
+        since_id: int | None = None,
+        if_none_match: str | None = Header(default=None),  # noqa: B008
+    ) -> Response:
+        def build() -> tuple[bytes, dict[str, str]]:
+            signals = db.get_signal_log(strategy=strategy, limit=limit, since_id=since_id)
+            return _json_bytes(signals), _max_id_header(signals, since_id)
+
+        return db_response(("signals", strategy, limit, since_id), build, if_none_match)
+
+    # Snapshot rows are append-only, so each row's JSON is built (and its
+    # positions validated) once and reused by later polls. Only the rows of the
+    # latest response are kept.
+    snapshot_fragments: dict[tuple[object, object], str] = {}
 
     @app.get("/api/snapshots")
-    def api_snapshots(limit: int = 100) -> JSONResponse:
-        snapshots = db.get_portfolio_snapshots(limit=limit)
-        result = []
-        for snap in snapshots:
-            row = _serialize_row(snap)
-            if "positions_json" in row and isinstance(row["positions_json"], str):
-                try:
-                    row["positions"] = json.loads(row["positions_json"])
-                except (json.JSONDecodeError, TypeError):
-                    row["positions"] = {}
-                del row["positions_json"]
-            result.append(row)
-        return JSONResponse(result)
+    def api_snapshots(
+        limit: int = 100,
+        since_id: int | None = None,
+        if_none_match: str | None = Header(default=None),  # noqa: B008
+    ) -> Response:
+        def build() -> tuple[bytes, dict[str, str]]:
+            nonlocal snapshot_fragments
+            previous = snapshot_fragments
+            snapshots = db.get_portfolio_snapshots(limit=limit, since_id=since_id)
+            fragments: dict[tuple[object, object], str] = {}
+            for snap in snapshots:
+                key = (snap.get("id"), snap.get("timestamp"))
+                fragment = previous.get(key)
+                fragments[key] = fragment if fragment is not None else _snapshot_json(snap)
+            if since_id is None:
+                # Incremental polls return a tail only; keep the full window for reuse.
+                snapshot_fragments = fragments
+            return ("[" + ",".join(fragments.values()) + "]").encode(), _max_id_header(snapshots, since_id)
+
+        return db_response(("snapshots", limit, since_id), build, if_none_match)
 
     @app.get("/api/positions")
     def api_positions() -> JSONResponse:
@@ -98,80 +187,174 @@ def create_app(db: Database, get_portfolio: Any, get_recent_trades: Any) -> Any:
                     "unrealized_pnl_pct": round(unrealized_pnl_pct, 2),
                 }
             )
-        return JSONResponse(positions)
+        return FastJSONResponse(positions)
 
     @app.get("/api/strategy-performance")
-    def api_strategy_performance() -> JSONResponse:
-        trades = db.get_trades()
-        signals = db.get_signal_log(limit=10000)
-
-        # Group trades by strategy
-        stats: dict[str, StrategyStats] = {}
-        for t in trades:
-            strat = str(t.get("strategy", "unknown"))
-            bucket = _get_strategy_stats_bucket(stats, strat)
-            bucket["trade_count"] += 1
-            size = _to_float(t.get("size", 0))
-            side = str(t.get("side", "")).lower()
-            if side == "sell":
-                bucket["net_pnl"] += size
-                bucket["wins"] += 1
-            elif side == "buy":
-                bucket["net_pnl"] -= size
-
-        # Count signals per strategy
-        for s in signals:
-            strat = str(s.get("strategy", "unknown"))
-            bucket = _get_strategy_stats_bucket(stats, strat)
-            bucket["signal_count"] += 1
-
-        result = []
-        for strat, bucket_stats in stats.items():
-            trade_count = bucket_stats["trade_count"]
-            win_rate = (bucket_stats["wins"] / trade_count * 100) if trade_count else 0.0
-            result.append(
-                {
-                    "strategy": strat,
-                    "trade_count": trade_count,
-                    "win_rate": round(win_rate, 1),
-                    "net_pnl": round(bucket_stats["net_pnl"], 4),
-                    "signal_count": bucket_stats["signal_count"],
-                }
-            )
-        return JSONResponse(result)
+    def api_strategy_performance(if_none_match: str | None = Header(default=None)) -> Response:  # noqa: B008
+        def build() -> tuple[bytes, dict[str, str]]:
+            # SQLite does the grouping: one row per (strategy, side) and per strategy
+            # instead of every trade and the last 10k signals.
+            stats: dict[str, StrategyStats] = {}
+            for row in db.get_trade_totals():
+                bucket = _get_strategy_stats_bucket(stats, str(row.get("strategy", "unknown")))
+                count = int(_to_float(row.get("count", 0)))
+                size = _to_float(row.get("total_size", 0))
+                bucket["trade_count"] += count
+                side = str(row.get("side", "")).lower()
+                if side == "sell":
+                    bucket["net_pnl"] += size
+                    bucket["wins"] += count
+                elif side == "buy":
+                    bucket["net_pnl"] -= size
+
+            for row in db.get_signal_counts(limit=10000):
+                bucket = _get_strategy_stats_bucket(stats, str(row.get("strategy", "unknown")))
+                bucket["signal_count"] += int(_to_float(row.get("count", 0)))
+
+            result = []
+            for strat, bucket_stats in stats.items():
+                trade_count = bucket_stats["trade_count"]
+                win_rate = (bucket_stats["wins"] / trade_count * 100) if trade_count else 0.0
+                result.append(
+                    {
+                        "strategy": strat,
+                        "trade_count": trade_count,
+                        "win_rate": round(win_rate, 1),
+                        "net_pnl": round(bucket_stats["net_pnl"], 4),
+                        "signal_count": bucket_stats["signal_count"],
+                    }
+                )
+            return _json_bytes(result), {}
+
+        return db_response(("strategy-performance",), build, if_none_match)
 
     @app.get("/api/config-changes")
-    def api_config_changes(limit: int = 20) -> JSONResponse:
-        changes = db.get_config_changes(limit=limit)
-        result = []
-        for c in changes:
-            row = _serialize_row(c)
-            if "diff_json" in row and isinstance(row["diff_json"], str):
-                try:
-                    row["diff"] = json.loads(row["diff_json"])
-                except (json.JSONDecodeError, TypeError):
-                    row["diff"] = {}
-                del row["diff_json"]
-            if "full_config_json" in row:
-                del row["full_config_json"]
-            result.append(row)
-        return JSONResponse(result)
+    def api_config_changes(
+        limit: int = 20,
+        if_none_match: str | None = Header(default=None),  # noqa: B008
+    ) -> Response:
+        def build() -> tuple[bytes, dict[str, str]]:
+            changes = db.get_config_changes(limit=limit)
+            result = []
+            for c in changes:
+                row = _serialize_row(c)
+                if "diff_json" in row and isinstance(row["diff_json"], str):
+                    try:
+                        row["diff"] = json.loads(row["diff_json"])
+                    except (json.JSONDecodeError, TypeError):
+                        row["diff"] = {}
+                    del row["diff_json"]
+                if "full_config_json" in row:
+                    del row["full_config_json"]
+                result.append(row)
+            return _json_bytes(result), {}
+
+        return db_response(("config-changes", limit), build, if_none_match)
 
     @app.get("/api/conditional-orders")
-    def api_conditional_orders(limit: int = 50) -> JSONResponse:
-        orders = db.get_all_conditional_orders(limit=limit)
-        return JSONResponse([_serialize_row(o) for o in orders])
+    def api_conditional_orders(
+        limit: int = 50,
+        if_none_match: str | None = Header(default=None),  # noqa: B008
+    ) -> Response:
+        def build() -> tuple[bytes, dict[str, str]]:
+            return _json_bytes(db.get_all_conditional_orders(limit=limit)), {}
+
+        return db_response(("conditional-orders", limit), build, if_none_match)
+
+    # The page is static for the life of the process: read it once and let
+    # browsers revalidate against its ETag instead of re-streaming the file.
+    page = (_STATIC_DIR / "dashboard.html").read_bytes()
+    page_etag = f'"{hashlib.blake2b(page, digest_size=8).hexdigest()}"'
+    page_headers = {"ETag": page_etag, "Cache-Control": "max-age=60"}
 
     @app.get("/")
-    def dashboard_page() -> FileResponse:
-        return FileResponse(_STATIC_DIR / "dashboard.html", media_type="text/html")
+    async def dashboard_page(if_none_match: str | None = Header(default=None)) -> Response:  # noqa: B008
+        if if_none_match == page_etag:
+            return Response(status_code=304, headers=page_headers)
+        return Response(page, media_type="text/html", headers=page_headers)
 
     return app
 
 
+def build_app_factory() -> Any:
+    """Build the dashboard app inside a uvicorn worker process.
+
+    Multi-worker uvicorn imports the app by name in each spawned worker, so
+    nothing can be handed over in memory: every worker loads the config and
+    opens its own Orchestrator (and SQLite connection) from the paths in
+    ``CONFIG_PATH_ENV`` and ``DB_PATH_ENV``.
+    """
+    from polymarket_agent.config import AppConfig, load_config  # noqa: PLC0415
+    from polymarket_agent.orchestrator import Orchestrator  # noqa: PLC0415
+
+    config_path = Path(os.environ[CONFIG_PATH_ENV])
+    cfg = load_config(config_path) if config_path.exists() else AppConfig()
+    orch = Orchestrator(config=cfg, db_path=Path(os.environ[DB_PATH_ENV]))
+    return create_app(db=orch.db, get_portfolio=orch.get_portfolio, get_recent_trades=orch.get_recent_trades)
+
+
 def _serialize_row(row: dict[str, object]) -> dict[str, Any]:
     """Convert a DB row dict to JSON-serializable form."""
-    return {k: str(v) if not isinstance(v, (int, float, bool, str, type(None))) else v for k, v in row.items()}
+    # An exact-type set lookup per value instead of a five-way isinstance(); SQLite
+    # only ever hands back these scalar types and bytes.
+    return {k: v if type(v) in _JSON_SCALAR_TYPES else str(v) for k, v in row.items()}
+
+
+def _snapshot_json(snap: dict[str, object]) -> str:
+    """Encode a snapshot row with its decoded ``positions`` in place of ``positions_json``.
+
+    The stored positions are already JSON text and dominate the payload, so
+    they are validated and spliced in as-is rather than decoded and re-encoded.
+    """
+    row = _serialize_row(snap)
+    raw = row.pop("positions_json", "{}")
+    if not isinstance(raw, str) or not _is_json(raw):
+        raw = "{}"
+    return f'{_dumps(row)[:-1]},"positions":{raw}}}' if row else f'{{"positions":{raw}}}'
+
+
+def _max_id_header(rows: list[dict[str, object]], since_id: int | None) -> dict[str, str]:
+    """Return an ``X-Max-Id`` header for id-descending *rows* so clients can poll with ``since_id``."""
+    max_id = rows[0].get("id") if rows else since_id
+    return {} if max_id is None else {"X-Max-Id": str(max_id)}
+
+
+def _json_bytes(obj: object) -> bytes:
+    """Encode *obj* with pydantic-core's Rust encoder.
+
+    Values with no JSON form fall back to ``str()``, so DB rows that are only
+    read (not reshaped) are passed through without a :func:`_serialize_row` copy.
+    """
+    return to_json(obj, fallback=str)
+
+
+def _weak_etag(body: bytes) -> str:
+    """Return a weak ETag for a JSON response *body*."""
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _dumps(obj: object) -> str:
+    """Encode *obj* as compact JSON text, exactly as the dashboard's responses render it."""
+    return to_json(obj).decode()
+
+
+def _is_json(text: str) -> bool:
+    """Return True if *text* is standard JSON that a browser's ``JSON.parse`` accepts.
+
+    ``json.loads`` also takes ``NaN`` and ``Infinity``, which the orchestrator
+    writes for non-finite prices; spliced raw, they would break the response.
+    """
+    try:
+        json.loads(text, parse_constant=_reject_json_constant)
+    except ValueError:
+        return False
+    return True
+
+
+def _reject_json_constant(name: str) -> float:
+    """``parse_constant`` hook refusing the non-standard ``NaN``/``Infinity`` literals."""
+    msg = f"non-standard JSON constant {name}"
+    raise ValueError(msg)
 
 
 def _to_float(value: Any, default: float = 0.0) -> float:
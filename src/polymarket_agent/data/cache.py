@@ -5,10 +5,16 @@ from typing import Any
 
 
 class TTLCache:
-    """In-memory cache with per-key TTL expiration."""
+    """In-memory cache with per-key TTL expiration.
 
-    def __init__(self, default_ttl: float = 60.0) -> None:
+    The cache holds at most *max_entries* keys. When full, expired entries are
+    purged first and then the least recently written keys are evicted, so a
+    long-running agent quoting an ever-changing set of tokens stays bounded.
+    """
+
+    def __init__(self, default_ttl: float = 60.0, max_entries: int = 4096) -> None:
         self._default_ttl = default_ttl
+        self._max_entries = max_entries
         self._store: dict[str, tuple[Any, float]] = {}
 
     def get(self, key: str) -> Any | None:
@@ -17,13 +23,26 @@ class TTLCache:
             return None
         value, expires_at = entry
         if time.monotonic() > expires_at:
-            del self._store[key]
+            # pop, not del: pooled lookups (PolymarketData.get_prices) may race to expire a key
+            self._store.pop(key, None)
             return None
         return value
 
     def set(self, key: str, value: Any, ttl: float | None = None) -> None:
-        expires_at = time.monotonic() + (ttl if ttl is not None else self._default_ttl)
+        now = time.monotonic()
+        expires_at = now + (ttl if ttl is not None else self._default_ttl)
+        # Re-insert so dict order tracks write recency for eviction
+        self._store.pop(key, None)
+        if len(self._store) >= self._max_entries:
+            self._evict(now)
         self._store[key] = (value, expires_at)
 
     def clear(self) -> None:
         self._store.clear()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then the oldest writes until there is room for one more."""
+        for key in [k for k, (_, expires_at) in list(self._store.items()) if now > expires_at]:
+            self._store.pop(key, None)
+        while len(self._store) >= self._max_entries:
+            self._store.pop(next(iter(self._store)), None)
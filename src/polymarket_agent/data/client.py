@@ -1,17 +1,27 @@
 """PolymarketData CLI wrapper client.
 
 Wraps the ``polymarket`` CLI tool, parsing JSON output into typed Pydantic
-models and caching results with a configurable TTL.
+models and caching results with a configurable TTL. Output is decoded with
+pydantic-core's JSON parser rather than ``json.loads``.
 """
 
-import json
 import subprocess
+import threading
 import time as _time
-from typing import Any
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from pydantic_core import from_json
 
 from polymarket_agent.data.cache import TTLCache
 from polymarket_agent.data.models import Event, Market, OrderBook, Position, PricePoint, Spread, Trader, Volume
 
+T = TypeVar("T")
+
+# Distinct CLI list outputs whose parsed models are kept for reuse
+_PARSED_MAX_ENTRIES = 16
+
 
 class PolymarketData:
     """Thin wrapper around the ``polymarket`` CLI.
@@ -23,6 +33,9 @@ class PolymarketData:
 
     def __init__(self, cache_ttl: float = 30.0) -> None:
         self._cache = TTLCache(default_ttl=cache_ttl)
+        self._parsed: dict[tuple[object, str], list[Any]] = {}
+        self._inflight: dict[str, Future[str]] = {}
+        self._inflight_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Public API
@@ -35,8 +48,7 @@ class PolymarketData:
             args.extend(["--tag", tag])
 
         raw = self._run_cli_cached(f"markets:{tag}:{limit}", args)
-        data: list[dict[str, Any]] = json.loads(raw)
-        return [Market.from_cli(m) for m in data]
+        return self._parse_list(raw, Market.from_cli)
 
     def get_events(self, *, tag: str | None = None, limit: int = 50) -> list[Event]:
         """Return active events from the Polymarket CLI."""
@@ -45,14 +57,13 @@ class PolymarketData:
             args.extend(["--tag", tag])
 
         raw = self._run_cli_cached(f"events:{tag}:{limit}", args)
-        data: list[dict[str, Any]] = json.loads(raw)
-        return [Event.from_cli(e) for e in data]
+        return self._parse_list(raw, Event.from_cli)
 
     def get_orderbook(self, token_id: str) -> OrderBook:
         """Return the order book for a CLOB token."""
         args = ["polymarket", "clob", "book", token_id, "-o", "json"]
         raw = self._run_cli_cached(f"book:{token_id}", args)
-        data: dict[str, Any] = json.loads(raw)
+        data: dict[str, Any] = from_json(raw)
         return OrderBook.from_cli(data)
 
     def get_market(self, market_id: str) -> Market | None:
@@ -60,23 +71,23 @@ class PolymarketData:
         args = ["polymarket", "markets", "get", market_id, "-o", "json"]
         try:
             raw = self._run_cli_cached(f"market:{market_id}", args)
-            data: dict[str, Any] = json.loads(raw)
+            data: dict[str, Any] = from_json(raw)
             return Market.from_cli(data)
-        except (RuntimeError, json.JSONDecodeError, KeyError):
+        except (RuntimeError, ValueError, KeyError):
             return None
 
     def search_markets(self, query: str, *, limit: int = 25) -> list[Market]:
         """Search active markets by keyword in question text."""
         markets = self.get_active_markets(limit=100)
         query_lower = query.lower()
-        matches = [m for m in markets if query_lower in m.question.lower()]
+        matches = [m for m in markets if query_lower in m.question_lower]
         return matches[:limit]
 
     def get_leaderboard(self, *, period: str = "month") -> list[Trader]:
         """Return top traders from the Polymarket leaderboard."""
         args = ["polymarket", "data", "leaderboard", "--period", period, "-o", "json"]
         raw = self._run_cli_cached(f"leaderboard:{period}", args)
-        data: list[dict[str, Any]] = json.loads(raw)
+        data: list[dict[str, Any]] = from_json(raw)
         return [Trader.from_cli(t, rank=i + 1) for i, t in enumerate(data)]
 
     def get_trader_trades(self, address: str, *, limit: int = 20) -> list[dict[str, Any]]:
@@ -84,9 +95,9 @@ class PolymarketData:
         args = ["polymarket", "data", "trades", address, "--limit", str(limit), "-o", "json"]
         try:
             raw = self._run_cli_cached(f"trades:{address}:{limit}", args)
-            data = json.loads(raw)
+            data = from_json(raw)
             return data if isinstance(data, list) else []
-        except (RuntimeError, json.JSONDecodeError):
+        except (RuntimeError, ValueError):
             return []
 
     def get_event(self, event_id: str) -> Event | None:
@@ -94,9 +105,9 @@ class PolymarketData:
         args = ["polymarket", "events", "get", event_id, "-o", "json"]
         try:
             raw = self._run_cli_cached(f"event:{event_id}", args)
-            data: dict[str, Any] = json.loads(raw)
+            data: dict[str, Any] = from_json(raw)
             return Event.from_cli(data)
-        except (RuntimeError, json.JSONDecodeError, KeyError):
+        except (RuntimeError, ValueError, KeyError):
             return None
 
     def get_price(self, token_id: str) -> Spread:
@@ -104,25 +115,53 @@ class PolymarketData:
         book = self.get_orderbook(token_id)
         return Spread.from_orderbook(token_id, book)
 
+    def get_prices(self, token_ids: list[str], *, max_workers: int = 8) -> dict[str, Spread]:
+        """Return bid/ask/spread for several tokens, keyed by token ID.
+
+        The ``polymarket`` CLI has no multi-token price command, so the order
+        books are fetched on a thread pool to overlap the subprocess round-trips.
+        Tokens whose lookup fails are omitted from the result.
+        """
+        return self._fetch_pooled(token_ids, self.get_price, max_workers)
+
+    def get_price_histories(
+        self,
+        token_ids: list[str],
+        *,
+        interval: str = "1d",
+        fidelity: int = 60,
+        max_workers: int = 8,
+    ) -> dict[str, list[PricePoint]]:
+        """Return price histories for several tokens, keyed by token ID.
+
+        Like :meth:`get_prices`, the per-token CLI calls run on a thread pool.
+        Tokens whose lookup fails are omitted from the result.
+        """
+        return self._fetch_pooled(
+            token_ids,
+            lambda token_id: self.get_price_history(token_id, interval=interval, fidelity=fidelity),
+            max_workers,
+        )
+
     def get_spread(self, token_id: str) -> Spread:
         """Return the bid-ask spread for a token from the CLOB."""
         args = ["polymarket", "clob", "spread", token_id, "-o", "json"]
         raw = self._run_cli_cached(f"spread:{token_id}", args)
-        data: dict[str, Any] = json.loads(raw)
+        data: dict[str, Any] = from_json(raw)
         return Spread.from_cli(token_id, data)
 
     def get_volume(self, event_id: str) -> Volume:
         """Return aggregated volume for an event."""
         args = ["polymarket", "data", "volume", event_id, "-o", "json"]
         raw = self._run_cli_cached(f"volume:{event_id}", args)
-        data: list[dict[str, Any]] = json.loads(raw)
+        data: list[dict[str, Any]] = from_json(raw)
         return Volume.from_cli(event_id, data)
 
     def get_positions(self, address: str, *, limit: int = 25) -> list[Position]:
         """Return open positions for a wallet address."""
         args = ["polymarket", "data", "positions", address, "--limit", str(limit), "-o", "json"]
         raw = self._run_cli_cached(f"positions:{address}:{limit}", args)
-        data: list[dict[str, Any]] = json.loads(raw)
+        data: list[dict[str, Any]] = from_json(raw)
         return [Position.from_cli(p) for p in data]
 
     def get_price_history(
@@ -146,13 +185,49 @@ class PolymarketData:
             "json",
         ]
         raw = self._run_cli_cached(f"history:{token_id}:{interval}:{fidelity}", args)
-        data: list[dict[str, Any]] = json.loads(raw)
+        data: list[dict[str, Any]] = from_json(raw)
         return [PricePoint.from_cli(p) for p in data]
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _fetch_pooled(token_ids: list[str], fetch: Callable[[str], T], max_workers: int) -> dict[str, T]:
+        """Run *fetch* for each distinct token on a thread pool, dropping tokens that fail."""
+        unique_ids = list(dict.fromkeys(token_ids))
+        if not unique_ids:
+            return {}
+
+        def _fetch(token_id: str) -> T | None:
+            # Any failure, including a missing polymarket binary (FileNotFoundError),
+            # only drops that token: callers fall back to their own prices
+            try:
+                return fetch(token_id)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as pool:
+            results = list(pool.map(_fetch, unique_ids))
+        return {token_id: result for token_id, result in zip(unique_ids, results, strict=True) if result is not None}
+
+    def _parse_list(self, raw: str, parse: Callable[[dict[str, Any]], T]) -> list[T]:
+        """Parse a CLI JSON list with *parse*, reusing the models built for identical output.
+
+        A TTL refresh often returns the same text, so the models are keyed by
+        content rather than by command. Callers get a fresh list (the
+        orchestrator sorts it in place) of the shared, never-mutated models.
+        """
+        key = (parse, raw)
+        models = self._parsed.get(key)
+        if models is None:
+            data: list[dict[str, Any]] = from_json(raw)
+            models = [parse(item) for item in data]
+            if len(self._parsed) >= _PARSED_MAX_ENTRIES:
+                self._parsed.pop(next(iter(self._parsed)), None)
+            self._parsed[key] = models
+        return list(models)
+
     def _run_cli(self, args: list[str], *, timeout: float = 30.0, retries: int = 3) -> str:
         """Execute a ``polymarket`` CLI command and return its stdout.
 
@@ -175,11 +250,33 @@ class PolymarketData:
         raise RuntimeError(msg)
 
     def _run_cli_cached(self, key: str, args: list[str]) -> str:
-        """Return cached CLI output or execute and cache the result."""
-        cached = self._cache.get(key)
-        if cached is not None:
-            assert isinstance(cached, str)
-            return cached
-        raw = self._run_cli(args)
-        self._cache.set(key, raw)
-        return raw
+        """Return cached CLI output or execute and cache the result.
+
+        Concurrent misses on the same key share one subprocess: the first
+        caller runs it and the others wait on its future, getting the same
+        output or exception.
+        """
+        with self._inflight_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                assert isinstance(cached, str)
+                return cached
+            future = self._inflight.get(key)
+            owner = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+        try:
+            raw = self._run_cli(args)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            # Cache before leaving the in-flight map so late callers never miss both
+            self._cache.set(key, raw)
+            future.set_result(raw)
+            return raw
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
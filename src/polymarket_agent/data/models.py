@@ -1,18 +1,19 @@
 """Pydantic data models for Polymarket CLI JSON output."""
 
-import json
+from functools import cached_property
 from typing import Any
 
 from pydantic import BaseModel, Field
+from pydantic_core import from_json
 
 
 def _parse_json_field(data: dict[str, Any], key: str) -> list[Any]:
     """Parse a CLI field that may be a JSON-encoded string or already a list."""
     raw = data.get(key)
-    if raw is None:
-        return []
+    if type(raw) is list:  # Native arrays, as in nested event payloads
+        return raw
     if isinstance(raw, str):
-        parsed = json.loads(raw)
+        parsed = from_json(raw)
         return parsed if isinstance(parsed, list) else []
     return raw if isinstance(raw, list) else []
 
@@ -103,6 +104,11 @@ class Market(BaseModel):
             group_item_title=_str_field(data, "groupItemTitle"),
         )
 
+    @cached_property
+    def question_lower(self) -> str:
+        """Lower-cased question for keyword matching, computed once per market."""
+        return self.question.lower()
+
 
 class Event(BaseModel):
     """A Polymarket event containing one or more markets."""
@@ -285,11 +291,23 @@ class Position(BaseModel):
 
 
 class OrderBook(BaseModel):
-    """An order book with asks and bids."""
+    """An order book with asks and bids.
+
+    Books are not mutated after parsing, so the best ask and bid are found
+    once on first use and shared by the price properties below.
+    """
 
     asks: list[OrderBookLevel]
     bids: list[OrderBookLevel]
 
+    @cached_property
+    def _best_prices(self) -> tuple[float, float]:
+        """``(best_ask, best_bid)``, found with a single scan of each side."""
+        return (
+            min((level.price for level in self.asks), default=0.0),
+            max((level.price for level in self.bids), default=0.0),
+        )
+
     @classmethod
     def from_cli(cls, data: dict[str, Any]) -> "OrderBook":
         """Parse an order-book dict from the polymarket CLI JSON output."""
@@ -300,30 +318,28 @@ class OrderBook(BaseModel):
     @property
     def best_ask(self) -> float:
         """Lowest ask price."""
-        if not self.asks:
-            return 0.0
-        return min(level.price for level in self.asks)
+        return self._best_prices[0]
 
     @property
     def best_bid(self) -> float:
         """Highest bid price."""
-        if not self.bids:
-            return 0.0
-        return max(level.price for level in self.bids)
+        return self._best_prices[1]
 
     @property
     def midpoint(self) -> float:
         """Midpoint between best bid and best ask. Returns 0.0 if either side is empty."""
         if not self.asks or not self.bids:
             return 0.0
-        return (self.best_ask + self.best_bid) / 2
+        best_ask, best_bid = self._best_prices
+        return (best_ask + best_bid) / 2
 
     @property
     def spread(self) -> float:
         """Spread between best ask and best bid. Returns 0.0 if either side is empty."""
         if not self.asks or not self.bids:
             return 0.0
-        return self.best_ask - self.best_bid
+        best_ask, best_bid = self._best_prices
+        return best_ask - best_bid
 
 
 # ---------------------------------------------------------------------------
@@ -1,11 +1,16 @@
 """SQLite database for trade logging and portfolio state."""
 
 import sqlite3
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import astuple, dataclass
 from pathlib import Path
+from typing import Literal
 
 from polymarket_agent.orders import ConditionalOrder, OrderStatus, OrderType
 
+_READ_CACHE_MAX_ENTRIES = 32
+
 
 @dataclass
 class Trade:
@@ -21,11 +26,23 @@ class Trade:
 
 
 class Database:
-    """SQLite database for persisting trades and portfolio state."""
+    """SQLite database for persisting trades and portfolio state.
+
+    Pass ``":memory:"`` as the path for a private, non-persistent database.
+    """
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path | str) -> None:
         self._conn = sqlite3.connect(str(path), check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
+        # WAL lets the dashboard and CLI read while the agent writes; NORMAL sync is
+        # still crash-safe under WAL. mmap and a 64 MiB page cache speed history scans.
+        for pragma in ("journal_mode=WAL", "synchronous=NORMAL", "mmap_size=268435456", "cache_size=-65536"):
+            self._conn.execute(f"PRAGMA {pragma}")
+        self._bulk_depth = 0
+        # Read-through cache for the trade/snapshot history queries, valid for one data stamp
+        self._write_seq = 0
+        # (stamp, rows by key), swapped as one tuple so a stamp never pairs with another stamp's rows
+        self._read_cache: tuple[tuple[int, int], dict[tuple[object, ...], list[dict[str, object]]]] = ((-1, -1), {})
         self._create_tables()
 
     def _create_tables(self) -> None:
@@ -42,6 +59,7 @@ class Database:
                 reason TEXT NOT NULL
             )
         """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_ts_strategy ON trades(timestamp, strategy)")
         self._conn.execute("""
             CREATE TABLE IF NOT EXISTS signal_log (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -64,6 +82,7 @@ class Database:
                 positions_json TEXT NOT NULL DEFAULT '{}'
             )
         """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_portfolio_snapshots_ts ON portfolio_snapshots(timestamp)")
         self._conn.execute("""
             CREATE TABLE IF NOT EXISTS conditional_orders (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -133,6 +152,81 @@ class Database:
         """)
         self._conn.commit()
 
+    def _commit(self) -> None:
+        """Commit the current write unless a :meth:`bulk_transaction` is open."""
+        self._write_seq += 1
+        if self._bulk_depth == 0:
+            self._conn.commit()
+
+    def data_stamp(self) -> tuple[int, int]:
+        """Return a value that changes whenever any connection modifies the database.
+
+        ``PRAGMA data_version`` only moves for commits made by *other*
+        connections, so it is paired with a counter of this connection's writes.
+        """
+        (data_version,) = self._conn.execute("PRAGMA data_version").fetchone()
+        return self._write_seq, int(data_version)
+
+    def _fetch_cached(
+        self, key: tuple[object, ...], query: str, params: Sequence[str | int]
+    ) -> list[dict[str, object]]:
+        """Run a read query, reusing the previous rows while the database is unchanged.
+
+        Callers get fresh dicts each time, so mutating a result can't leak
+        into the cache.
+        """
+        stamp = self.data_stamp()
+        cache_stamp, cache = self._read_cache
+        if stamp != cache_stamp or len(cache) >= _READ_CACHE_MAX_ENTRIES:
+            # Bind a fresh dict instead of clearing the shared one: a dashboard
+            # thread still holding the old dict then stores its rows there, not
+            # under the new stamp
+            cache = {}
+            self._read_cache = (stamp, cache)
+        rows = cache.get(key)
+        if rows is None:
+            rows = [dict(row) for row in self._conn.execute(query, params).fetchall()]
+            cache[key] = rows
+        return [dict(row) for row in rows]
+
+    @contextmanager
+    def bulk_transaction(self) -> Iterator[None]:
+        """Group every write inside the block into one transaction.
+
+        Write methods skip their per-call commit while the block is open; the
+        outermost block commits once on exit, or rolls back if it raises.
+        """
+        self._bulk_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0:
+                self._conn.rollback()
+                self._write_seq += 1
+            raise
+        self._bulk_depth -= 1
+        if self._bulk_depth == 0:
+            self._conn.commit()
+
+    @contextmanager
+    def read_transaction(self) -> Iterator[None]:
+        """Serve every read inside the block from one point-in-time view of the database.
+
+        The queries share a single deferred transaction instead of each taking
+        and releasing its own read lock. Inside an already open transaction
+        (e.g. a :meth:`bulk_transaction`) the block just joins it.
+        """
+        if self._conn.in_transaction:
+            yield
+            return
+        self._conn.execute("BEGIN")
+        try:
+            yield
+        finally:
+            if self._conn.in_transaction:
+                self._conn.commit()
+
     # ------------------------------------------------------------------
     # Trade methods
     # ------------------------------------------------------------------
@@ -144,7 +238,7 @@ class Database:
             " VALUES (?, ?, ?, ?, ?, ?, ?)",
             astuple(trade),
         )
-        self._conn.commit()
+        self._commit()
 
     def get_trades(
         self,
@@ -168,9 +262,42 @@ class Database:
             params.append(since)
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
-        query += " ORDER BY timestamp DESC"
-        rows = self._conn.execute(query, params).fetchall()
-        return [dict(row) for row in rows]
+        # Spell out the tie-break: trades within one second (every backtest step)
+        # keep insertion order, whether or not the planner walks the timestamp index.
+        query += " ORDER BY timestamp DESC, id ASC"
+        return self._fetch_cached(("trades", strategy, since), query, params)
+
+    def get_recent_trades(self, *, limit: int = 10, since: str | None = None) -> list[dict[str, object]]:
+        """Return the newest *limit* trades, in the same order as :meth:`get_trades`.
+
+        SQLite stops after *limit* rows instead of materializing the full history.
+        """
+        query = "SELECT * FROM trades"
+        params: list[str | int] = []
+        if since:
+            query += " WHERE timestamp >= ?"
+            params.append(since)
+        query += " ORDER BY timestamp DESC, id ASC LIMIT ?"
+        params.append(limit)
+        return self._fetch_cached(("recent_trades", limit, since), query, params)
+
+    def get_trade_totals(self, since: str | None = None) -> list[dict[str, object]]:
+        """Summarize trades per strategy and side in SQL.
+
+        Args:
+            since: If provided, only count trades with timestamp >= this ISO value.
+
+        Returns:
+            One row per ``(strategy, side)`` with ``count`` and ``total_size``,
+            most recently traded first.
+        """
+        query = "SELECT strategy, side, COUNT(*) AS count, SUM(size) AS total_size FROM trades"
+        params: list[str] = []
+        if since:
+            query += " WHERE timestamp >= ?"
+            params.append(since)
+        query += " GROUP BY strategy, side ORDER BY MAX(timestamp) DESC"
+        return self._fetch_cached(("trade_totals", since), query, params)
 
     # ------------------------------------------------------------------
     # Signal log methods
@@ -193,20 +320,51 @@ class Database:
             " VALUES (?, ?, ?, ?, ?, ?, ?)",
             (strategy, market_id, token_id, side, confidence, size, status),
         )
-        self._conn.commit()
+        self._commit()
 
-    def get_signal_log(self, *, strategy: str | None = None, limit: int = 100) -> list[dict[str, object]]:
-        """Retrieve signal log entries, optionally filtered by strategy."""
+    def get_signal_log(
+        self, *, strategy: str | None = None, limit: int = 100, since_id: int | None = None
+    ) -> list[dict[str, object]]:
+        """Retrieve signal log entries, optionally filtered by strategy.
+
+        Args:
+            strategy: If provided, only return signals from this strategy.
+            limit: Maximum number of entries to return, most recent first.
+            since_id: If provided, only return entries with an id above this one.
+        """
         query = "SELECT * FROM signal_log"
-        params: tuple[str | int, ...] = ()
+        conditions: list[str] = []
+        params: list[str | int] = []
         if strategy:
-            query += " WHERE strategy = ?"
-            params = (strategy,)
+            conditions.append("strategy = ?")
+            params.append(strategy)
+        if since_id is not None:
+            conditions.append("id > ?")
+            params.append(since_id)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
         query += " ORDER BY id DESC LIMIT ?"
-        params = (*params, limit)
+        params.append(limit)
         rows = self._conn.execute(query, params).fetchall()
         return [dict(row) for row in rows]
 
+    def get_signal_counts(self, *, limit: int | None = None) -> list[dict[str, object]]:
+        """Count signal log entries per strategy in SQL.
+
+        Args:
+            limit: If provided, only count the most recent *limit* entries.
+
+        Returns:
+            One row per strategy with ``count``, most recently signalled first.
+        """
+        source = "signal_log"
+        params: list[int] = []
+        if limit is not None:
+            source = "(SELECT id, strategy FROM signal_log ORDER BY id DESC LIMIT ?)"
+            params.append(limit)
+        query = f"SELECT strategy, COUNT(*) AS count FROM {source} GROUP BY strategy ORDER BY MAX(id) DESC"
+        return self._fetch_cached(("signal_counts", limit), query, params)
+
     # ------------------------------------------------------------------
     # Portfolio snapshot methods
     # ------------------------------------------------------------------
@@ -223,29 +381,47 @@ class Database:
             "INSERT INTO portfolio_snapshots (balance, total_value, positions_json) VALUES (?, ?, ?)",
             (balance, total_value, positions_json),
         )
-        self._conn.commit()
+        self._commit()
 
     def get_portfolio_snapshots(
         self,
         *,
         limit: int = 100,
         since: str | None = None,
+        order: Literal["asc", "desc"] = "desc",
+        since_id: int | None = None,
     ) -> list[dict[str, object]]:
-        """Retrieve portfolio snapshots, most recent first.
+        """Retrieve the most recent portfolio snapshots.
 
         Args:
             limit: Maximum number of snapshots to return.
             since: If provided, only return snapshots with timestamp >= this ISO value.
+            order: ``"desc"`` returns them most recent first; ``"asc"`` returns
+                the same snapshots in chronological order.
+            since_id: If provided, only return snapshots with an id above this one.
         """
         query = "SELECT * FROM portfolio_snapshots"
+        conditions: list[str] = []
         params: list[str | int] = []
         if since:
-            query += " WHERE timestamp >= ?"
-            params.append(since)
+            # Left to itself the planner walks ids newest-first and filters every
+            # row, scanning the whole table for a short window. Seeking the first
+            # id in range through the timestamp index bounds that walk.
+            conditions.append(
+                "timestamp >= ? AND id >= (SELECT MIN(id) FROM portfolio_snapshots"
+                " INDEXED BY idx_portfolio_snapshots_ts WHERE timestamp >= ?)"
+            )
+            params.extend((since, since))
+        if since_id is not None:
+            conditions.append("id > ?")
+            params.append(since_id)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
         query += " ORDER BY id DESC LIMIT ?"
         params.append(limit)
-        rows = self._conn.execute(query, params).fetchall()
-        return [dict(row) for row in rows]
+        if order == "asc":
+            query = f"SELECT * FROM ({query}) ORDER BY id"
+        return self._fetch_cached(("portfolio_snapshots", limit, since, order, since_id), query, params)
 
     def get_latest_snapshot(self) -> dict[str, object] | None:
         """Return the most recent portfolio snapshot, or None if none exist."""
@@ -287,7 +463,7 @@ class Database:
                 reason,
             ),
         )
-        self._conn.commit()
+        self._commit()
         return cursor.lastrowid or 0
 
     def get_active_conditional_orders(self) -> list[ConditionalOrder]:
@@ -309,7 +485,7 @@ class Database:
                 "UPDATE conditional_orders SET status = ? WHERE id = ?",
                 (status.value, order_id),
             )
-        self._conn.commit()
+        self._commit()
 
     def cancel_conditional_orders_for_token(self, token_id: str) -> int:
         """Cancel all active conditional orders for the given token. Returns count cancelled."""
@@ -317,7 +493,7 @@ class Database:
             "UPDATE conditional_orders SET status = ? WHERE token_id = ? AND status = 'active'",
             (OrderStatus.CANCELLED.value, token_id),
         )
-        self._conn.commit()
+        self._commit()
         return cursor.rowcount
 
     def update_high_watermark(self, order_id: int, high_watermark: float) -> None:
@@ -326,7 +502,7 @@ class Database:
             "UPDATE conditional_orders SET high_watermark = ? WHERE id = ?",
             (high_watermark, order_id),
         )
-        self._conn.commit()
+        self._commit()
 
     @staticmethod
     def _row_to_conditional_order(row: sqlite3.Row) -> ConditionalOrder:
@@ -382,7 +558,7 @@ class Database:
             " VALUES (?, ?, ?, ?, ?)",
             (row_id, lesson, key_factor, applicable_types, keywords),
         )
-        self._conn.commit()
+        self._commit()
         return row_id
 
     def search_reflections(self, query: str, *, limit: int = 5) -> list[dict[str, object]]:
@@ -437,7 +613,7 @@ class Database:
             " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
             (strategy, market_id, token_id, side, confidence, predicted_price, entry_price, size),
         )
-        self._conn.commit()
+        self._commit()
         return cursor.lastrowid or 0
 
     def resolve_signal_outcomes(
@@ -492,7 +668,7 @@ class Database:
             resolved_count += 1
 
         if resolved_count > 0:
-            self._conn.commit()
+            self._commit()
         return resolved_count
 
     def get_strategy_accuracy(self, strategy: str | None = None, min_samples: int = 0) -> list[dict[str, object]]:
@@ -597,7 +773,7 @@ class Database:
             "INSERT INTO config_changes (changed_by, diff_json, full_config_json) VALUES (?, ?, ?)",
             (changed_by, diff_json, full_config_json),
         )
-        self._conn.commit()
+        self._commit()
 
     def get_config_changes(self, limit: int = 50) -> list[dict[str, object]]:
         """Retrieve config changes, most recent first."""
@@ -490,7 +490,7 @@ def run_backtest(data_dir: str) -> dict[str, Any]:
     Args:
         data_dir: Path to directory containing CSV data files.
     """
-    from polymarket_agent.backtest.engine import BacktestEngine  # noqa: PLC0415
+    from polymarket_agent.backtest.engine import BacktestEngine, build_strategies  # noqa: PLC0415
     from polymarket_agent.backtest.historical import HistoricalDataProvider  # noqa: PLC0415
 
     data_path = Path(data_dir)
@@ -503,20 +503,7 @@ def run_backtest(data_dir: str) -> dict[str, Any]:
     if provider.total_steps == 0:
         return {"error": "No data loaded — check CSV files in the data directory"}
 
-    from polymarket_agent.orchestrator import STRATEGY_REGISTRY  # noqa: PLC0415
-
-    strategies = []
-    for name, params in ctx.config.strategies.items():
-        if not params.get("enabled", False):
-            continue
-        cls = STRATEGY_REGISTRY.get(name)
-        if cls is None:
-            continue
-        instance = cls()
-        instance.configure(params)
-        strategies.append(instance)
-
-    engine = BacktestEngine(config=ctx.config, strategies=strategies, data_provider=provider)
+    engine = BacktestEngine(config=ctx.config, strategies=build_strategies(ctx.config), data_provider=provider)
     result = engine.run()
     return result.to_dict()
 
@@ -213,7 +213,7 @@ class Orchestrator:
 
     def get_recent_trades(self, limit: int = 20) -> list[dict[str, object]]:
         """Return recent trades from the database."""
-        return self._db.get_trades()[:limit]
+        return self._db.get_recent_trades(limit=limit)
 
     @property
     def poll_interval(self) -> int:
@@ -1,7 +1,9 @@
 """Tests for the autotune module."""
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,6 +12,8 @@ from typer.testing import CliRunner
 
 from polymarket_agent.autotune import (
     _apply_changes,
+    _first_json_object,
+    _index_tunable,
     _init_client,
     _parse_changes,
     _validate_change,
@@ -29,6 +33,8 @@ _TUNABLE_PARAMS: list[dict[str, object]] = [
     {"path": "strategies.signal_trader.volume_threshold", "current": 2000, "min": 500, "max": 50000},
 ]
 
+_TUNABLE_BY_PATH = _index_tunable(_TUNABLE_PARAMS)
+
 _SAMPLE_EVAL: dict[str, object] = {
     "metrics": {"total_return": -0.05, "sharpe_ratio": 0.2, "win_rate": 0.4},
     "tunable_parameters": _TUNABLE_PARAMS,
@@ -37,6 +43,14 @@ _SAMPLE_EVAL: dict[str, object] = {
 }
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the autotune response cache out of the user's home directory."""
+    cache_dir = tmp_path / "autotune_cache"
+    monkeypatch.setattr("polymarket_agent.autotune._CACHE_DIR", cache_dir)
+    return cache_dir
+
+
 def _make_config_file(tmp_path: Path) -> Path:
     """Create a minimal config.yaml for testing."""
     cfg = {
@@ -50,23 +64,36 @@ def _make_config_file(tmp_path: Path) -> Path:
     return p
 
 
+def _chunks(text: str, size: int = 7) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
 def _mock_anthropic_client(response_text: str) -> MagicMock:
+    def _stream(**_: Any) -> MagicMock:
+        manager = MagicMock()
+        manager.__enter__.return_value.text_stream = iter(_chunks(response_text))
+        return manager
+
     client = MagicMock()
-    response = MagicMock()
-    response.content = [MagicMock(text=response_text)]
-    client.messages.create.return_value = response
+    client.messages.stream.side_effect = _stream
     return client
 
 
 def _mock_openai_client(response_text: str) -> MagicMock:
+    def _create(**_: Any) -> MagicMock:
+        chunks = []
+        for piece in _chunks(response_text):
+            choice = MagicMock()
+            choice.delta.content = piece
+            chunk = MagicMock()
+            chunk.choices = [choice]
+            chunks.append(chunk)
+        response = MagicMock()
+        response.__iter__.return_value = iter(chunks)
+        return response
+
     client = MagicMock()
-    message = MagicMock()
-    message.content = response_text
-    choice = MagicMock()
-    choice.message = message
-    response = MagicMock()
-    response.choices = [choice]
-    client.chat.completions.create.return_value = response
+    client.chat.completions.create.side_effect = _create
     return client
 
 
@@ -94,6 +121,11 @@ def test_parse_strips_markdown_fences() -> None:
     assert len(changes) == 1
 
 
+def test_parse_strips_bare_fences() -> None:
+    raw = '```\n{"changes": [{"path": "a.b", "value": 1, "reason": "x"}]}```'
+    assert len(_parse_changes(raw)) == 1
+
+
 def test_parse_invalid_json_raises() -> None:
     with pytest.raises(json.JSONDecodeError):
         _parse_changes("not json at all")
@@ -104,6 +136,27 @@ def test_parse_missing_changes_key_raises() -> None:
         _parse_changes('{"adjustments": []}')
 
 
+def test_first_json_object_stops_at_closing_brace() -> None:
+    text = 'Sure! {"changes": [{"path": "a.b", "value": 1, "reason": "has } and \\" inside"}]} Hope that helps.'
+    assert _first_json_object(_chunks(text, 3)) == text[text.index("{") : text.rindex("}") + 1]
+
+
+def test_first_json_object_stops_consuming_stream() -> None:
+    consumed: list[str] = []
+
+    def stream() -> Iterator[str]:
+        for piece in ['{"changes": []}', " trailing", " prose"]:
+            consumed.append(piece)
+            yield piece
+
+    assert _first_json_object(stream()) == '{"changes": []}'
+    assert consumed == ['{"changes": []}']
+
+
+def test_first_json_object_returns_text_without_object() -> None:
+    assert _first_json_object(["I cannot ", "provide JSON"]) == "I cannot provide JSON"
+
+
 # ------------------------------------------------------------------
 # _validate_change tests
 # ------------------------------------------------------------------
@@ -111,39 +164,39 @@ def test_parse_missing_changes_key_raises() -> None:
 
 def test_validate_valid_change() -> None:
     change = {"path": "aggregation.min_confidence", "value": 0.5, "reason": "raise bar"}
-    result = _validate_change(change, _TUNABLE_PARAMS)
+    result = _validate_change(change, _TUNABLE_BY_PATH)
     assert result is not None
     assert result["value"] == 0.5
 
 
 def test_validate_clamps_out_of_range() -> None:
     change = {"path": "aggregation.min_confidence", "value": 2.0, "reason": "too high"}
-    result = _validate_change(change, _TUNABLE_PARAMS)
+    result = _validate_change(change, _TUNABLE_BY_PATH)
     assert result is not None
     assert result["value"] == 0.9  # clamped to max
 
 
 def test_validate_clamps_below_min() -> None:
     change = {"path": "aggregation.min_confidence", "value": 0.01, "reason": "too low"}
-    result = _validate_change(change, _TUNABLE_PARAMS)
+    result = _validate_change(change, _TUNABLE_BY_PATH)
     assert result is not None
     assert result["value"] == 0.1  # clamped to min
 
 
 def test_validate_rejects_non_tunable() -> None:
     change = {"path": "mode", "value": "live", "reason": "switch mode"}
-    result = _validate_change(change, _TUNABLE_PARAMS)
+    result = _validate_change(change, _TUNABLE_BY_PATH)
     assert result is None
 
 
 def test_validate_rejects_malformed() -> None:
-    result = _validate_change({"bad": "data"}, _TUNABLE_PARAMS)
+    result = _validate_change({"bad": "data"}, _TUNABLE_BY_PATH)
     assert result is None
 
 
 def test_validate_preserves_int_type() -> None:
     change = {"path": "risk.max_position_size", "value": 300.0, "reason": "increase"}
-    result = _validate_change(change, _TUNABLE_PARAMS)
+    result = _validate_change(change, _TUNABLE_BY_PATH)
     assert result is not None
     assert result["value"] == 300.0  # float, but _apply_changes handles int conversion
 
@@ -265,6 +318,46 @@ def test_run_autotune_invalid_json_response(tmp_path: Path) -> None:
         run_autotune(eval_data, config_path, provider="openai", model="gpt-4o")
 
 
+def test_run_autotune_reuses_cached_response(tmp_path: Path) -> None:
+    config_path = _make_config_file(tmp_path)
+    llm_response = json.dumps({"changes": [{"path": "aggregation.min_confidence", "value": 0.5, "reason": "x"}]})
+    mock_client = _mock_openai_client(llm_response)
+    eval_data = {**_SAMPLE_EVAL, "config_file_path": str(config_path)}
+
+    with patch("polymarket_agent.autotune._init_client", return_value=(mock_client, "openai")):
+        first = run_autotune(eval_data, config_path, provider="openai", model="gpt-4o")
+        second = run_autotune(eval_data, config_path, provider="openai", model="gpt-4o")
+
+    assert first == second
+    assert mock_client.chat.completions.create.call_count == 1
+
+
+def test_run_autotune_no_cache_bypasses_cache(tmp_path: Path) -> None:
+    config_path = _make_config_file(tmp_path)
+    mock_client = _mock_openai_client('{"changes": []}')
+    eval_data = {**_SAMPLE_EVAL, "config_file_path": str(config_path)}
+
+    with patch("polymarket_agent.autotune._init_client", return_value=(mock_client, "openai")):
+        run_autotune(eval_data, config_path, provider="openai", model="gpt-4o")
+        run_autotune(eval_data, config_path, provider="openai", model="gpt-4o", no_cache=True)
+
+    assert mock_client.chat.completions.create.call_count == 2
+
+
+def test_run_autotune_does_not_cache_invalid_response(tmp_path: Path, _isolated_cache: Path) -> None:
+    config_path = _make_config_file(tmp_path)
+    mock_client = _mock_openai_client("I cannot provide JSON")
+    eval_data = {**_SAMPLE_EVAL, "config_file_path": str(config_path)}
+
+    with (
+        patch("polymarket_agent.autotune._init_client", return_value=(mock_client, "openai")),
+        pytest.raises(json.JSONDecodeError),
+    ):
+        run_autotune(eval_data, config_path, provider="openai", model="gpt-4o")
+
+    assert not list(_isolated_cache.glob("*.txt"))
+
+
 def test_init_client_rejects_unknown_provider() -> None:
     with pytest.raises(ValueError, match="provider"):
         _init_client(provider="claude", api_key_env=None, base_url=None)
@@ -283,14 +376,15 @@ def test_validate_new_strategy_params() -> None:
         {"path": "strategies.date_curve_trader.arb_confidence", "current": 0.7, "min": 0.5, "max": 1.0},
         {"path": "exit_manager.max_hold_hours", "current": 24, "min": 1, "max": 168},
     ]
+    params = _index_tunable(new_params)
 
     # Valid change
-    result = _validate_change({"path": "strategies.whale_follower.top_n", "value": 15, "reason": "more whales"}, new_params)
+    result = _validate_change({"path": "strategies.whale_follower.top_n", "value": 15, "reason": "more whales"}, params)
     assert result is not None
     assert result["value"] == 15.0
 
     # Clamp above max
-    result = _validate_change({"path": "strategies.whale_follower.top_n", "value": 50, "reason": "too many"}, new_params)
+    result = _validate_change({"path": "strategies.whale_follower.top_n", "value": 50, "reason": "too many"}, params)
     assert result is not None
     assert result["value"] == 25.0  # clamped
 
@@ -301,18 +395,18 @@ def test_validate_new_strategy_params() -> None:
             "value": 0.001,
             "reason": "too tight",
         },
-        new_params,
+        params,
     )
     assert result is not None
     assert result["value"] == 0.01  # clamped
 
     # Int type preserved for top_n (current is int)
-    result = _validate_change({"path": "strategies.whale_follower.top_n", "value": 7.6, "reason": "round"}, new_params)
+    result = _validate_change({"path": "strategies.whale_follower.top_n", "value": 7.6, "reason": "round"}, params)
     assert result is not None
     assert result["value"] == 8.0  # rounded because current is int
 
     # Exit manager param valid
-    result = _validate_change({"path": "exit_manager.max_hold_hours", "value": 48, "reason": "longer hold"}, new_params)
+    result = _validate_change({"path": "exit_manager.max_hold_hours", "value": 48, "reason": "longer hold"}, params)
     assert result is not None
     assert result["value"] == 48.0
 
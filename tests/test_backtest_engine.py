@@ -1,10 +1,11 @@
 """Tests for the BacktestEngine."""
 
 import csv
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
-from polymarket_agent.backtest.engine import BacktestEngine, BacktestResult
+from polymarket_agent.backtest.engine import BacktestEngine, BacktestResult, build_strategies
 from polymarket_agent.backtest.historical import HistoricalDataProvider
 from polymarket_agent.config import AppConfig
 from polymarket_agent.strategies.base import Signal, Strategy
@@ -159,6 +160,8 @@ class TestBacktestEngine:
         assert "snapshots" in d
         assert "total_trades" in d
         assert d["metrics"]["total_trades"] == 0
+        assert d["metrics"] == asdict(result.metrics)
+        assert d["snapshots"] == [asdict(s) for s in result.snapshots]
 
     def test_multiple_strategies(self, tmp_path: Path) -> None:
         _write_csv(tmp_path / "data.csv", _sample_rows())
@@ -209,3 +212,15 @@ class TestBacktestEngine:
         result = engine.run(end="2024-01-01")
         assert len(result.snapshots) == 1
         assert result.snapshots[0].timestamp == "2024-01-01"
+
+
+def test_build_strategies_skips_disabled_and_unknown() -> None:
+    config = AppConfig(
+        strategies={
+            "signal_trader": {"enabled": True, "volume_threshold": 123},
+            "arbitrageur": {"enabled": False},
+            "no_such_strategy": {"enabled": True},
+        }
+    )
+    strategies = build_strategies(config)
+    assert [type(s).__name__ for s in strategies] == ["SignalTrader"]
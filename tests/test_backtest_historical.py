@@ -99,6 +99,25 @@ class TestHistoricalDataProvider:
         markets = provider.get_active_markets()
         assert len(markets) == 2  # Two markets at day 2
 
+    def test_markets_reused_within_time_step(self, tmp_path: Path) -> None:
+        _write_csv(tmp_path / "data.csv", _sample_rows())
+        provider = HistoricalDataProvider(tmp_path)
+        provider.advance("2024-01-02T00:00:00Z")
+        first = provider.get_active_markets()
+        assert provider.get_active_markets() == first
+        assert provider.get_market("200") is first[1]
+        assert provider.get_active_markets(limit=1) == first[:1]
+        provider.advance("2024-01-03T00:00:00Z")
+        assert [m.id for m in provider.get_active_markets()] == ["100"]
+        assert provider.get_market("200") is None
+
+    def test_repeated_strings_are_shared(self, tmp_path: Path) -> None:
+        _write_csv(tmp_path / "data.csv", _sample_rows())
+        provider = HistoricalDataProvider(tmp_path)
+        tok1 = [tok for tok in provider._token_ids if tok == "0xtok1"]
+        assert len(tok1) > 1
+        assert all(tok is tok1[0] for tok in tok1)
+
     def test_get_orderbook(self, tmp_path: Path) -> None:
         _write_csv(tmp_path / "data.csv", _sample_rows())
         provider = HistoricalDataProvider(tmp_path)
@@ -128,6 +147,16 @@ class TestHistoricalDataProvider:
         history = provider.get_price_history("0xtok1")
         assert len(history) == 3  # Three entries for tok1
 
+    def test_price_lookups_respect_cursor(self, tmp_path: Path) -> None:
+        _write_csv(tmp_path / "data.csv", _sample_rows())
+        provider = HistoricalDataProvider(tmp_path)
+        provider.advance("2024-01-02T00:00:00Z")
+        history = provider.get_price_history("0xtok1")
+        assert [p.price for p in history] == [0.60, 0.65]
+        assert abs(provider.get_price("0xtok1").bid - 0.64) < 1e-9
+        provider.advance("2024-01-03T00:00:00Z")
+        assert abs(provider.get_price("0xtok2").bid - 0.24) < 1e-9
+
     def test_default_spread_param(self, tmp_path: Path) -> None:
         _write_csv(tmp_path / "data.csv", _sample_rows())
         provider = HistoricalDataProvider(tmp_path, default_spread=0.10)
@@ -163,6 +192,48 @@ class TestHistoricalDataProvider:
         provider = HistoricalDataProvider(tmp_path)
         assert provider.total_steps == 1
 
+    def test_all_rows_malformed(self, tmp_path: Path) -> None:
+        row = dict(_sample_rows()[0], yes_price="bad")
+        _write_csv(tmp_path / "data.csv", [row])
+        provider = HistoricalDataProvider(tmp_path)
+        assert provider.total_steps == 0
+        assert provider.unique_timestamps == []
+        assert provider.get_active_markets() == []
+
+    def test_quoted_question_with_commas(self, tmp_path: Path) -> None:
+        row = dict(_sample_rows()[0], question="Will it rain, snow, or hail?")
+        _write_csv(tmp_path / "data.csv", [row])
+        provider = HistoricalDataProvider(tmp_path)
+        assert provider.get_active_markets()[0].question == "Will it rain, snow, or hail?"
+
+    def test_many_csv_files_parsed_in_parallel(self, tmp_path: Path) -> None:
+        rows = _sample_rows()
+        for i, row in enumerate(rows):
+            _write_csv(tmp_path / f"part{i}.csv", [row])
+        provider = HistoricalDataProvider(tmp_path)
+        assert provider.total_steps == 5
+        assert len(provider.unique_timestamps) == 3
+        provider.advance("2024-01-03T00:00:00Z")
+        assert [p.price for p in provider.get_price_history("0xtok1")] == [0.60, 0.65, 0.70]
+
+    def test_chunked_parse_matches_single_pass(self, tmp_path: Path) -> None:
+        rows = [*_sample_rows(), dict(_sample_rows()[0], yes_price="bad"), _sample_rows()[1]]
+        _write_csv(tmp_path / "data.csv", rows)
+        eager = HistoricalDataProvider(tmp_path, chunk_bytes=0)
+        chunked = HistoricalDataProvider(tmp_path, chunk_bytes=64)  # a batch every row or two
+        assert chunked.total_steps == eager.total_steps == 6
+        assert chunked.unique_timestamps == eager.unique_timestamps
+        for provider in (eager, chunked):
+            provider.advance("2024-01-03T00:00:00Z")
+        assert chunked.get_price_history("0xtok1") == eager.get_price_history("0xtok1")
+        assert chunked.get_active_markets() == eager.get_active_markets()
+
+    def test_empty_csv_file_ignored(self, tmp_path: Path) -> None:
+        (tmp_path / "a.csv").write_text("")
+        _write_csv(tmp_path / "b.csv", _sample_rows())
+        provider = HistoricalDataProvider(tmp_path)
+        assert provider.total_steps == 5
+
     def test_multiple_csv_files(self, tmp_path: Path) -> None:
         rows1 = [_sample_rows()[0]]
         rows2 = [_sample_rows()[2]]
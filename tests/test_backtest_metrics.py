@@ -1,6 +1,18 @@
 """Tests for backtest performance metrics."""
 
-from polymarket_agent.backtest.metrics import BacktestMetrics, PortfolioSnapshot, compute_metrics
+import math
+import statistics
+
+import numpy as np
+import pytest
+
+from polymarket_agent.backtest.metrics import (
+    BacktestMetrics,
+    PortfolioSnapshot,
+    _estimate_periods_per_year,
+    compute_metrics,
+    compute_metrics_arrays,
+)
 
 
 class TestComputeMetrics:
@@ -53,6 +65,36 @@ class TestComputeMetrics:
         metrics = compute_metrics([], snapshots, 1000.0)
         assert metrics.sharpe_ratio > 0
 
+    def test_sharpe_ratio_matches_sample_statistics(self) -> None:
+        values = [1e9 + (i % 3) * 1e3 + i * 10 for i in range(50)]
+        snapshots = [
+            PortfolioSnapshot(timestamp=f"2024-01-01T{i // 60:02d}:{i % 60:02d}:00", balance=v, total_value=v)
+            for i, v in enumerate(values)
+        ]
+        returns = [(b - a) / a for a, b in zip(values, values[1:], strict=False)]
+        periods_per_year = 365.25 * 24 * 60
+        expected = statistics.mean(returns) / statistics.stdev(returns) * math.sqrt(periods_per_year)
+        metrics = compute_metrics([], snapshots, 1e9)
+        assert metrics.sharpe_ratio == pytest.approx(expected, rel=1e-9)
+
+    def test_periods_per_year_skips_unparseable_timestamps(self) -> None:
+        stamps = ["2024-01-01T00:00:00Z", "bad", "2024-01-01T02:00:00Z"]
+        assert _estimate_periods_per_year(stamps) == pytest.approx(365.25 * 12)
+        assert _estimate_periods_per_year([stamps[0], stamps[2]]) == pytest.approx(365.25 * 12)
+
+    def test_arrays_match_snapshot_api(self) -> None:
+        values = [1000.0, 1040.0, 990.0, 1100.0]
+        stamps = [f"2024-01-0{i + 1}T00:00:00Z" for i in range(len(values))]
+        snapshots = [
+            PortfolioSnapshot(timestamp=t, balance=0.0, total_value=v) for t, v in zip(stamps, values, strict=True)
+        ]
+        trades: list[dict[str, object]] = [
+            {"side": "buy", "token_id": "t", "price": 0.4},
+            {"side": "sell", "token_id": "t", "price": 0.5},
+        ]
+        expected = compute_metrics(trades, snapshots, 1000.0)
+        assert compute_metrics_arrays(trades, stamps, np.array(values), 1000.0) == expected
+
     def test_sharpe_ratio_flat(self) -> None:
         snapshots = [PortfolioSnapshot(timestamp=f"t{i}", balance=1000.0, total_value=1000.0) for i in range(5)]
         metrics = compute_metrics([], snapshots, 1000.0)
@@ -40,3 +40,19 @@ def test_cache_clear():
     cache.clear()
     assert cache.get("a") is None
     assert cache.get("b") is None
+
+
+def test_cache_bounded_evicts_expired_then_oldest():
+    cache = TTLCache(default_ttl=60, max_entries=3)
+    cache.set("stale", 0, ttl=0.01)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    time.sleep(0.02)
+    cache.set("c", 3)
+    assert cache.get("stale") is None
+    assert [cache.get(k) for k in ("a", "b", "c")] == [1, 2, 3]
+
+    cache.set("a", 10)  # rewrite makes "a" the newest entry
+    cache.set("d", 4)
+    assert cache.get("b") is None
+    assert [cache.get(k) for k in ("a", "c", "d")] == [10, 3, 4]
@@ -1,9 +1,27 @@
 """Tests for CLI entry point."""
 
+import json
+import os
+import re
+import subprocess
+import sys
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+import typer
 from typer.testing import CliRunner
 
 from polymarket_agent import __version__
-from polymarket_agent.cli import app
+from polymarket_agent.cli import (
+    _echo_json,
+    _parse_period,
+    _period_delta,
+    _prefetch_prices,
+    _sniff_subcommand,
+    app,
+)
 
 runner = CliRunner()
 
@@ -26,11 +44,117 @@ def test_cli_help():
     assert "polymarket-agent" in result.stdout.lower() or "Polymarket" in result.stdout
 
 
+def test_sniff_subcommand():
+    assert _sniff_subcommand(["/usr/bin/polymarket-agent", "report", "--json"]) == "report"
+    assert _sniff_subcommand(["polymarket-agent", "-V"]) is None
+    assert _sniff_subcommand(["polymarket-agent", "--help"]) is None
+    assert _sniff_subcommand(["polymarket-agent", "nope"]) is None
+    # Only the console script is sniffed (pytest's own argv must register everything)
+    assert _sniff_subcommand(["pytest", "run"]) is None
+
+
+def test_parse_period_returns_sqlite_timestamp():
+    assert re.fullmatch(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d", _parse_period("24h"))
+    assert _parse_period("7d") < _parse_period("30m")
+    with pytest.raises(typer.BadParameter):
+        _parse_period("3w")
+
+
+def test_period_delta_is_memoized():
+    assert _period_delta("7D") == timedelta(days=7)
+    assert _period_delta("90m") is _period_delta("90m")
+
+
 def test_cli_status():
     result = runner.invoke(app, ["status"])
     assert result.exit_code == 0
 
 
+def test_cli_report_without_positions_skips_data_client(tmp_path, monkeypatch):
+    def _no_quotes(*args, **kwargs):
+        raise AssertionError("no prices should be requested without open positions")
+
+    monkeypatch.setattr("polymarket_agent.data.client.PolymarketData.get_prices", _no_quotes)
+    db_path = tmp_path / "test.db"
+    for command in ("status", "report"):
+        result = runner.invoke(app, [command, "--config", str(tmp_path / "missing.yaml"), "--db", str(db_path)])
+        assert result.exit_code == 0, result.output
+
+
+def test_cli_status_and_report_fall_back_to_entry_price_without_polymarket_binary(tmp_path, mocker):
+    from polymarket_agent.db import Database  # noqa: PLC0415
+
+    db_path = tmp_path / "test.db"
+    db = Database(db_path)
+    db.record_portfolio_snapshot(
+        balance=900.0,
+        total_value=1000.0,
+        positions_json=json.dumps({"0xtok1": {"shares": 100.0, "avg_price": 0.4}}),
+    )
+    db.close()
+    mocker.patch("polymarket_agent.data.client.subprocess.run", side_effect=FileNotFoundError("polymarket"))
+    args = ["--config", str(tmp_path / "missing.yaml"), "--db", str(db_path)]
+
+    result = runner.invoke(app, ["status", *args])
+    assert result.exit_code == 0, result.output
+    assert "0xtok1           100.00 $ 0.4000 $ 0.4000 +$    0.00 +   0.0%" in result.stdout
+
+    result = runner.invoke(app, ["report", *args])
+    assert result.exit_code == 0, result.output
+    assert "0xtok1         $ 0.4000 $ 0.4000 +    0.00 +   0.0%" in result.stdout
+
+
+def test_cli_report_renders_entry_prices_when_prefetch_fails(tmp_path, mocker):
+    from polymarket_agent.db import Database  # noqa: PLC0415
+
+    db_path = tmp_path / "test.db"
+    db = Database(db_path)
+    db.record_portfolio_snapshot(
+        balance=900.0,
+        total_value=1000.0,
+        positions_json=json.dumps({"0xtok1": {"shares": 100.0, "avg_price": 0.4}}),
+    )
+    db.close()
+    mocker.patch("polymarket_agent.cli._fetch_prices", side_effect=FileNotFoundError("polymarket"))
+
+    result = runner.invoke(app, ["report", "--config", str(tmp_path / "missing.yaml"), "--db", str(db_path)])
+    assert result.exit_code == 0, result.output
+    assert "0xtok1         $ 0.4000 $ 0.4000 +    0.00 +   0.0%" in result.stdout
+
+
+def test_cli_run_prints_tick_status_line(tmp_path, mocker):
+    orch = mocker.MagicMock(poll_interval=1)
+    orch.tick.return_value = {"markets_fetched": 3, "signals_generated": 2, "trades_executed": 1}
+    orch.get_portfolio.return_value.balance = 987.5
+    mocker.patch("polymarket_agent.orchestrator.Orchestrator", return_value=orch)
+    mocker.patch("polymarket_agent.cli.time.sleep", side_effect=KeyboardInterrupt)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("mode: paper\n")
+
+    result = runner.invoke(app, ["run", "--config", str(config_path), "--db", str(tmp_path / "test.db")])
+    assert result.exit_code == 0
+    assert "[paper] markets=3 signals=2 trades=1 balance=$987.50\n" in result.stdout
+    assert "Stopped." in result.stdout
+    orch.close.assert_called_once()
+
+
+def test_cli_run_sleeps_until_absolute_deadline(tmp_path, mocker):
+    orch = mocker.MagicMock(poll_interval=10)
+    orch.tick.return_value = {"markets_fetched": 0, "signals_generated": 0, "trades_executed": 0}
+    orch.get_portfolio.return_value.balance = 0.0
+    mocker.patch("polymarket_agent.orchestrator.Orchestrator", return_value=orch)
+    mocker.patch("polymarket_agent.cli._start_config_watcher", return_value=None)
+    # start at 100; first tick takes 3s, second overruns to 125
+    mocker.patch("polymarket_agent.cli.time.monotonic", side_effect=[100.0, 103.0, 125.0])
+    sleep = mocker.patch("polymarket_agent.cli.time.sleep", side_effect=[None, KeyboardInterrupt])
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("mode: paper\n")
+
+    result = runner.invoke(app, ["run", "--config", str(config_path), "--db", str(tmp_path / "test.db")])
+    assert result.exit_code == 0
+    assert [c.args[0] for c in sleep.call_args_list] == [7.0, 0.0]
+
+
 def test_cli_run_live_requires_flag(tmp_path):
     """Live mode without --live flag should exit with error."""
     config_path = tmp_path / "live_config.yaml"
@@ -53,3 +177,66 @@ def test_cli_tick_live_requires_flag(tmp_path):
     assert result.exit_code == 1
     assert "requires the --live flag" in result.stdout
     assert "POLYMARKET_PRIVATE_KEY" not in result.stdout
+
+
+def test_echo_json_keeps_non_finite_floats(capsys):
+    _echo_json({"profit_factor": float("inf"), "since": Decimal("0.5")})
+    assert capsys.readouterr().out == '{\n  "profit_factor": Infinity,\n  "since": "0.5"\n}\n'
+
+
+def test_prefetch_prices(monkeypatch):
+    data = object()
+    assert _prefetch_prices(data, []).result() == {}
+    monkeypatch.setattr(
+        "polymarket_agent.cli._fetch_prices", lambda src, ids: {tid: len(tid) for tid in ids} if src is data else {}
+    )
+    assert _prefetch_prices(data, ["ab", "c"]).result(timeout=5) == {"ab": 2, "c": 1}
+
+
+def test_cli_import_stays_light():
+    # --version and --help must not pay for config, the orchestrator or its strategies
+    code = (
+        "import sys; sys.argv = ['polymarket-agent', '--version']; import polymarket_agent.cli; "
+        "print(sorted(m for m in ('queue', 'yaml', 'pydantic', 'numpy', 'polymarket_agent.config', "
+        "'polymarket_agent.orchestrator') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "[]"
+
+
+def test_backtest_compact_output_matches_indented(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "prices.csv").write_text(
+        "timestamp,market_id,question,yes_price,volume,token_id\n"
+        "2024-01-01T00:00:00Z,100,Will it rain?,0.60,50000,0xtok1\n"
+        "2024-01-02T00:00:00Z,100,Will it rain?,0.65,55000,0xtok1\n"
+    )
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("mode: paper\n")
+    pretty, compact = tmp_path / "pretty.json", tmp_path / "compact.json"
+    base = ["backtest", str(data_dir), "--config", str(config_path), "--trades"]
+    assert runner.invoke(app, [*base, "-o", str(pretty)]).exit_code == 0
+    assert runner.invoke(app, [*base, "-o", str(compact), "--compact"]).exit_code == 0
+    assert "\n" not in compact.read_text()
+    assert json.loads(compact.read_text()) == json.loads(pretty.read_text())
+
+
+def test_dashboard_workers_hand_uvicorn_the_app_factory(tmp_path, mocker, monkeypatch):
+    pytest.importorskip("uvicorn")
+    from polymarket_agent.dashboard.api import CONFIG_PATH_ENV, DB_PATH_ENV  # noqa: PLC0415
+
+    monkeypatch.delenv(CONFIG_PATH_ENV, raising=False)
+    monkeypatch.delenv(DB_PATH_ENV, raising=False)
+    build = mocker.patch("polymarket_agent.cli._build_orchestrator")
+    serve = mocker.patch("uvicorn.run")
+    db_path = tmp_path / "test.db"
+    result = runner.invoke(
+        app, ["dashboard", "--config", str(tmp_path / "missing.yaml"), "--db", str(db_path), "--workers", "3"]
+    )
+    assert result.exit_code == 0, result.output
+    build.assert_not_called()
+    assert serve.call_args.args == ("polymarket_agent.dashboard.api:build_app_factory",)
+    assert serve.call_args.kwargs["factory"] is True
+    assert serve.call_args.kwargs["workers"] == 3
+    assert Path(os.environ[DB_PATH_ENV]) == db_path.resolve()
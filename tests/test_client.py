@@ -2,6 +2,8 @@
 
 import json
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -152,6 +154,16 @@ def test_get_events(client):
     assert events[0].title == "Weather Events"
 
 
+def test_unchanged_cli_output_reuses_parsed_models(client):
+    first = client.get_active_markets(limit=1)
+    client._cache.clear()
+    second = client.get_active_markets(limit=1)
+    assert second is not first
+    assert second[0] is first[0]
+    assert client.get_active_markets(limit=2)[0] is first[0]
+    assert client.get_events(limit=1)[0].title == "Weather Events"
+
+
 def test_get_orderbook(client):
     book = client.get_orderbook("0xtok1")
     assert book.best_bid == 0.55
@@ -202,6 +214,44 @@ def test_cli_timeout_raises(mocker):
         client.get_active_markets()
 
 
+def _run_concurrently(call, count=4):
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        futures = [pool.submit(call) for _ in range(count)]
+    return futures
+
+
+def test_concurrent_misses_share_one_cli_call(mocker):
+    release = threading.Event()
+
+    def _slow(args, **kwargs):
+        release.wait(5)
+        return _mock_run(args, **kwargs)
+
+    run = mocker.patch("polymarket_agent.data.client.subprocess.run", side_effect=_slow)
+    client = PolymarketData()
+    threading.Timer(0.1, release.set).start()
+    futures = _run_concurrently(lambda: client.get_active_markets(limit=1))
+    assert [f.result()[0].id for f in futures] == ["100"] * 4
+    assert run.call_count == 1
+    assert client._inflight == {}
+
+
+def test_concurrent_misses_share_cli_failure(mocker):
+    release = threading.Event()
+
+    def _timeout(args, **kwargs):
+        release.wait(5)
+        raise subprocess.TimeoutExpired(cmd="polymarket", timeout=30)
+
+    mocker.patch("polymarket_agent.data.client.subprocess.run", side_effect=_timeout)
+    client = PolymarketData()
+    threading.Timer(0.1, release.set).start()
+    for future in _run_concurrently(lambda: client.get_active_markets(limit=1)):
+        with pytest.raises(RuntimeError, match="timed out"):
+            future.result()
+    assert client._inflight == {}
+
+
 def test_get_event(client):
     """get_event returns a single Event by ID."""
     event = client.get_event("200")
@@ -221,6 +271,19 @@ def test_get_event_not_found(mocker):
     assert client.get_event("999") is None
 
 
+def test_malformed_cli_output_is_treated_as_missing(mocker):
+    """Unparseable CLI stdout is reported like a missing record, not raised."""
+
+    def _garbage(args, **kwargs):
+        return subprocess.CompletedProcess(args=args, returncode=0, stdout="Error: rate limited", stderr="")
+
+    mocker.patch("polymarket_agent.data.client.subprocess.run", side_effect=_garbage)
+    client = PolymarketData()
+    assert client.get_market("100") is None
+    assert client.get_event("200") is None
+    assert client.get_trader_trades("0xabc") == []
+
+
 def test_get_spread(client):
     """get_spread returns Spread from clob spread CLI."""
     spread = client.get_spread("0xtok1")
@@ -237,6 +300,47 @@ def test_get_price(client):
     assert price.spread == pytest.approx(0.10)
 
 
+def test_get_prices(client):
+    """get_prices returns one Spread per distinct token."""
+    prices = client.get_prices(["0xtok1", "0xtok2", "0xtok1"])
+    assert set(prices) == {"0xtok1", "0xtok2"}
+    assert prices["0xtok2"].bid == 0.55
+    assert client.get_prices([]) == {}
+
+
+def test_get_prices_omits_failed_tokens(mocker):
+    def _book_or_fail(args, **kwargs):
+        if args[3] == "0xbad":
+            return subprocess.CompletedProcess(args=args, returncode=1, stdout="", stderr="not found")
+        return subprocess.CompletedProcess(args=args, returncode=0, stdout=MOCK_BOOK_JSON, stderr="")
+
+    mocker.patch("polymarket_agent.data.client.subprocess.run", side_effect=_book_or_fail)
+    mocker.patch("polymarket_agent.data.client._time.sleep")
+    prices = PolymarketData().get_prices(["0xtok1", "0xbad"])
+    assert list(prices) == ["0xtok1"]
+
+
+def test_get_price_histories_passes_options_and_omits_failed_tokens(mocker):
+    def _history_or_fail(args, **kwargs):
+        if args[3] == "0xbad":
+            return subprocess.CompletedProcess(args=args, returncode=1, stdout="", stderr="not found")
+        stdout = json.dumps([{"timestamp": "2026-01-01", "price": 0.5 if args[5] == "1w" else 0.0}])
+        return subprocess.CompletedProcess(args=args, returncode=0, stdout=stdout, stderr="")
+
+    mocker.patch("polymarket_agent.data.client.subprocess.run", side_effect=_history_or_fail)
+    mocker.patch("polymarket_agent.data.client._time.sleep")
+    histories = PolymarketData().get_price_histories(["0xtok1", "0xbad", "0xtok1"], interval="1w")
+    assert list(histories) == ["0xtok1"]
+    assert histories["0xtok1"][0].price == 0.5
+
+
+def test_pooled_lookups_survive_missing_polymarket_binary(mocker):
+    mocker.patch("polymarket_agent.data.client.subprocess.run", side_effect=FileNotFoundError("polymarket"))
+    client = PolymarketData()
+    assert client.get_price_histories(["0xtok1", "0xtok2"]) == {}
+    assert client.get_prices(["0xtok1"]) == {}
+
+
 def test_get_volume(client):
     """get_volume returns total volume for an event."""
     volume = client.get_volume("200")
@@ -2,7 +2,9 @@
 
 from pathlib import Path
 
-from polymarket_agent.config import AppConfig, CategoryConfig, FocusConfig, load_config
+import yaml
+
+from polymarket_agent.config import _YAML_LOADER, AppConfig, CategoryConfig, FocusConfig, load_config
 
 SAMPLE_YAML = """\
 mode: paper
@@ -39,6 +41,19 @@ def test_load_config_from_yaml(tmp_path: Path) -> None:
     assert config.risk.max_position_size == 200.0
 
 
+def test_load_config_uses_libyaml_and_decodes_utf8(tmp_path: Path) -> None:
+    if yaml.__with_libyaml__:
+        assert _YAML_LOADER is yaml.CSafeLoader
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text('focus:\n  search_queries: ["élection présidentielle"]\n', encoding="utf-8")
+    assert load_config(config_file).focus.search_queries == ["élection présidentielle"]
+
+
+def test_enabled_strategies_filters_disabled() -> None:
+    config = AppConfig(strategies={"a": {"enabled": True, "x": 1}, "b": {"enabled": False}, "c": {}})
+    assert config.enabled_strategies == {"a": {"enabled": True, "x": 1}}
+
+
 def test_default_config() -> None:
     config = AppConfig()
     assert config.mode == "paper"
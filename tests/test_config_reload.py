@@ -1,9 +1,16 @@
 """Tests for config hot-reload functionality."""
 
+import os
+import queue
+import sys
 import tempfile
+import threading
 import time
 from pathlib import Path
 
+import pytest
+
+from polymarket_agent.cli import _drain, _load_config, _start_config_watcher
 from polymarket_agent.config import AppConfig, config_mtime
 from polymarket_agent.orchestrator import Orchestrator
 
@@ -29,6 +36,54 @@ def test_config_mtime_changes_after_write(tmp_path: Path) -> None:
     assert mtime2 >= mtime1
 
 
+def test_load_config_cached_until_contents_change(tmp_path: Path) -> None:
+    f = tmp_path / "config.yaml"
+    f.write_text("mode: paper\npoll_interval: 30\n")
+    first = _load_config(f)
+    assert _load_config(f) is first
+
+    # A bumped mtime with identical contents reuses the parsed config
+    st = f.stat()
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert _load_config(f) is first
+
+    f.write_text("mode: paper\npoll_interval: 45\n")
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+    reloaded = _load_config(f)
+    assert reloaded is not first
+    assert reloaded.poll_interval == 45
+
+
+def test_config_watcher_falls_back_without_watchfiles(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "watchfiles", None)
+    assert _start_config_watcher(tmp_path / "config.yaml", threading.Event()) is None
+
+
+def test_config_watcher_signals_changes(tmp_path: Path) -> None:
+    pytest.importorskip("watchfiles")
+    f = tmp_path / "config.yaml"
+    f.write_text("mode: paper\n")
+    stop = threading.Event()
+    changes = _start_config_watcher(f, stop)
+    assert changes is not None
+    try:
+        time.sleep(0.2)
+        (tmp_path / "other.yaml").write_text("ignored\n")
+        f.write_text("mode: paper\npoll_interval: 30\n")
+        changes.get(timeout=10)
+    finally:
+        stop.set()
+
+
+def test_drain_empties_queue() -> None:
+    changes: queue.Queue[None] = queue.Queue()
+    assert not _drain(changes)
+    changes.put(None)
+    changes.put(None)
+    assert _drain(changes)
+    assert changes.empty()
+
+
 def test_reload_config_updates_strategies() -> None:
     with tempfile.TemporaryDirectory() as tmpdir:
         config = AppConfig(
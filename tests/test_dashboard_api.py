@@ -73,6 +73,25 @@ class TestDashboardAPI:
         assert "total_value" in data
         assert "positions" in data
 
+    def test_portfolio_endpoint_etag_tracks_in_place_changes(self) -> None:
+        from fastapi.testclient import TestClient  # noqa: PLC0415
+
+        from polymarket_agent.dashboard.api import create_app  # noqa: PLC0415
+
+        position = {"shares": 10, "avg_price": 0.6}
+        portfolio = Portfolio(balance=950.0, positions={"tok1": position})
+        client = TestClient(create_app(db=self.db, get_portfolio=lambda: portfolio, get_recent_trades=_get_trades))
+
+        first = client.get("/api/portfolio")
+        etag = first.headers["etag"]
+        assert client.get("/api/portfolio", headers={"If-None-Match": etag}).status_code == 304
+
+        position["current_price"] = 0.7  # executors mutate position dicts in place
+        changed = client.get("/api/portfolio", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["total_value"] == pytest.approx(957.0)
+
     def test_trades_endpoint(self) -> None:
         resp = self.client.get("/api/trades?limit=10")
         assert resp.status_code == 200
@@ -102,6 +121,12 @@ class TestDashboardAPI:
         assert len(data) == 1
         assert data[0]["strategy"] == "signal_trader"
 
+    def test_signals_endpoint_renders_compact_utf8(self) -> None:
+        self.db.record_signal(strategy="élan", market_id="m1", token_id="t1", side="buy", confidence=0.5, size=1.0)
+        resp = self.client.get("/api/signals")
+        assert resp.headers["content-type"] == "application/json"
+        assert '"strategy":"élan"'.encode() in resp.content
+
     def test_signals_endpoint_filter_by_strategy(self) -> None:
         self.db.record_signal(
             strategy="arb",
@@ -144,6 +169,56 @@ class TestDashboardAPI:
         assert data[0]["total_value"] == 1050.0
         assert data[0]["positions"] == {"tok1": {"shares": 10}}
 
+    def test_snapshots_endpoint_reuses_rows_across_polls(self) -> None:
+        self.db.record_portfolio_snapshot(balance=1.0, total_value=1.0, positions_json='{"a": {"shares": 1}}')
+        first = self.client.get("/api/snapshots").json()
+        self.db.record_portfolio_snapshot(balance=2.0, total_value=2.0, positions_json='{"b": {"shares": 2}}')
+        second = self.client.get("/api/snapshots").json()
+        assert [row["balance"] for row in second] == [2.0, 1.0]
+        assert second[1] == first[0]
+        assert second[0]["positions"] == {"b": {"shares": 2}}
+        assert self.client.get("/api/snapshots?limit=1").json() == second[:1]
+
+    def test_snapshots_and_signals_poll_since_id(self) -> None:
+        for i in range(3):
+            self.db.record_portfolio_snapshot(balance=float(i), total_value=float(i))
+            self.db.record_signal(strategy="s", market_id="m", token_id="t", side="buy", confidence=0.5, size=1.0)
+        for path in ("/api/snapshots", "/api/signals"):
+            full = self.client.get(path)
+            assert full.headers["x-max-id"] == "3"
+            tail = self.client.get(f"{path}?since_id=1")
+            assert [row["id"] for row in tail.json()] == [3, 2]
+            idle = self.client.get(f"{path}?since_id=3")
+            assert idle.json() == []
+            assert idle.headers["x-max-id"] == "3"
+        assert len(self.client.get("/api/snapshots").json()) == 3
+
+    def test_db_endpoints_revalidate_until_the_next_write(self) -> None:
+        self.db.record_signal(strategy="s", market_id="m", token_id="t", side="buy", confidence=0.5, size=1.0)
+        first = self.client.get("/api/signals")
+        etag = first.headers["etag"]
+        assert first.headers["x-max-id"] == "1"
+        idle = self.client.get("/api/signals", headers={"If-None-Match": etag})
+        assert idle.status_code == 304
+        assert idle.headers["x-max-id"] == "1"
+        self.db.record_signal(strategy="s", market_id="m", token_id="t", side="sell", confidence=0.5, size=1.0)
+        changed = self.client.get("/api/signals", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert [row["id"] for row in changed.json()] == [2, 1]
+
+    def test_snapshots_endpoint_malformed_positions(self) -> None:
+        self.db.record_portfolio_snapshot(balance=1.0, total_value=1.0, positions_json='{"tok1": ')
+        self.db.record_portfolio_snapshot(balance=2.0, total_value=2.0, positions_json='{"é": {"shares": 1}}')
+        self.db.record_portfolio_snapshot(
+            balance=3.0, total_value=3.0, positions_json='{"tok1": {"shares": 1, "current_price": NaN}}'
+        )
+        resp = self.client.get("/api/snapshots")
+        assert resp.status_code == 200
+        assert "NaN" not in resp.text
+        assert [row["positions"] for row in resp.json()] == [{}, {"é": {"shares": 1}}, {}]
+        assert all("positions_json" not in row for row in resp.json())
+
     def test_positions_endpoint(self) -> None:
         resp = self.client.get("/api/positions")
         assert resp.status_code == 200
@@ -223,13 +298,13 @@ class TestDashboardAPI:
         assert strat["signal_count"] == 1
 
     def test_strategy_performance_handles_non_numeric_trade_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _mock_trades() -> list[dict[str, object]]:
+        def _mock_totals() -> list[dict[str, object]]:
             return [
-                {"strategy": "signal_trader", "side": "buy", "size": None},
-                {"strategy": "signal_trader", "side": "sell", "size": "bad"},
+                {"strategy": "signal_trader", "side": "buy", "count": 1, "total_size": None},
+                {"strategy": "signal_trader", "side": "sell", "count": 1, "total_size": "bad"},
             ]
 
-        monkeypatch.setattr(self.db, "get_trades", _mock_trades)
+        monkeypatch.setattr(self.db, "get_trade_totals", _mock_totals)
 
         resp = self.client.get("/api/strategy-performance")
         assert resp.status_code == 200
@@ -290,3 +365,46 @@ class TestDashboardAPI:
         resp = self.client.get("/")
         assert resp.status_code == 200
         assert "Polymarket Agent" in resp.text
+        assert resp.headers["content-type"].startswith("text/html")
+        revalidated = self.client.get("/", headers={"If-None-Match": resp.headers["etag"]})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+
+
+def test_serialize_row_stringifies_non_json_scalars() -> None:
+    pytest.importorskip("fastapi")
+    from polymarket_agent.dashboard.api import _serialize_row  # noqa: PLC0415
+
+    row: dict[str, object] = {"id": 1, "price": 0.5, "ok": True, "side": "buy", "note": None, "blob": b"x"}
+    out = _serialize_row(row)
+    assert out == {"id": 1, "price": 0.5, "ok": True, "side": "buy", "note": None, "blob": "b'x'"}
+    assert out is not row
+
+
+def test_build_app_factory_opens_database_from_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient  # noqa: PLC0415
+
+    from polymarket_agent.dashboard.api import CONFIG_PATH_ENV, DB_PATH_ENV, build_app_factory  # noqa: PLC0415
+
+    Database(tmp_path / "worker.db").record_signal(
+        strategy="arb", market_id="m1", token_id="t1", side="buy", confidence=0.9, size=10.0
+    )
+    monkeypatch.setenv(CONFIG_PATH_ENV, str(tmp_path / "missing.yaml"))
+    monkeypatch.setenv(DB_PATH_ENV, str(tmp_path / "worker.db"))
+    client = TestClient(build_app_factory())
+    assert [s["strategy"] for s in client.get("/api/signals").json()] == ["arb"]
+
+
+def test_json_responses_stringify_values_without_a_json_form(db: Database) -> None:
+    pytest.importorskip("fastapi")
+    from decimal import Decimal  # noqa: PLC0415
+
+    from fastapi.testclient import TestClient  # noqa: PLC0415
+
+    from polymarket_agent.dashboard.api import create_app  # noqa: PLC0415
+
+    app = create_app(
+        db=db, get_portfolio=_make_portfolio, get_recent_trades=lambda limit=50: [{"size": Decimal("2.5")}]
+    )
+    assert TestClient(app).get("/api/trades").json() == [{"size": "2.5"}]
@@ -1,5 +1,6 @@
 """Tests for SQLite database layer."""
 
+import sqlite3
 import tempfile
 from pathlib import Path
 
@@ -18,6 +19,72 @@ def test_db_initializes_tables(db):
     assert db._conn is not None
 
 
+def test_in_memory_database():
+    with Database(":memory:") as mem_db:
+        mem_db.record_trade(
+            Trade(strategy="s", market_id="1", token_id="t1", side="buy", price=0.5, size=10, reason="r")
+        )
+        assert len(mem_db.get_trades()) == 1
+
+
+def test_bulk_transaction_commits_once_on_exit(tmp_path):
+    path = tmp_path / "bulk.db"
+    with Database(path) as bulk_db:
+        other = sqlite3.connect(str(path))
+        with bulk_db.bulk_transaction():
+            for i in range(3):
+                bulk_db.record_trade(
+                    Trade(strategy="s", market_id=str(i), token_id="t", side="buy", price=0.5, size=1, reason="r")
+                )
+            assert other.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 0
+        assert other.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 3
+        other.close()
+
+
+def test_bulk_transaction_rolls_back_on_error(db):
+    with pytest.raises(RuntimeError), db.bulk_transaction():
+        db.record_trade(Trade(strategy="s", market_id="1", token_id="t", side="buy", price=0.5, size=1, reason="r"))
+        raise RuntimeError("boom")
+    assert db.get_trades() == []
+
+
+def test_history_reads_cached_until_write(db):
+    db.record_trade(Trade(strategy="s", market_id="1", token_id="t", side="buy", price=0.5, size=1, reason="r"))
+    first = db.get_trades()
+    first[0]["market_id"] = "mutated"
+    first.reverse()
+    assert db.get_trades()[0]["market_id"] == "1"
+
+    db.record_trade(Trade(strategy="s", market_id="2", token_id="t", side="buy", price=0.5, size=1, reason="r"))
+    assert len(db.get_trades()) == 2
+    db.record_portfolio_snapshot(balance=1.0, total_value=1.0)
+    assert len(db.get_portfolio_snapshots()) == 1
+
+
+def test_history_cache_sees_other_connections(tmp_path):
+    path = tmp_path / "shared.db"
+    with Database(path) as reader, Database(path) as writer:
+        assert reader.get_trades() == []
+        writer.record_trade(Trade(strategy="s", market_id="1", token_id="t", side="buy", price=0.5, size=1, reason="r"))
+        assert len(reader.get_trades()) == 1
+
+
+def test_file_database_uses_wal(db):
+    assert db._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_read_transaction_sees_one_snapshot(tmp_path):
+    path = tmp_path / "snap.db"
+    with Database(path) as reader, Database(path) as writer:
+        with reader.read_transaction():
+            assert reader.get_trades() == []
+            writer.record_trade(
+                Trade(strategy="s", market_id="1", token_id="t", side="buy", price=0.5, size=1, reason="r")
+            )
+            assert reader.get_trade_totals() == []
+        assert len(reader.get_trades()) == 1
+
+
 def test_record_and_query_trade(db):
     db.record_trade(
         Trade(
@@ -44,6 +111,33 @@ def test_get_trades_by_strategy(db):
     assert trades[0]["strategy"] == "alpha"
 
 
+def test_get_trades_keeps_insertion_order_within_a_second(db):
+    for market_id in ("1", "2", "3"):
+        db.record_trade(
+            Trade(strategy="s", market_id=market_id, token_id="t", side="buy", price=0.5, size=1, reason="r")
+        )
+    assert [t["market_id"] for t in db.get_trades()] == ["1", "2", "3"]
+
+
+def test_get_recent_trades_matches_head_of_history(db):
+    for market_id in ("1", "2", "3"):
+        db.record_trade(
+            Trade(strategy="s", market_id=market_id, token_id="t", side="buy", price=0.5, size=1, reason="r")
+        )
+    assert db.get_recent_trades(limit=2) == db.get_trades()[:2]
+    assert db.get_recent_trades(limit=2, since="2999-01-01 00:00:00") == []
+
+
+def test_get_trade_totals_groups_by_strategy_and_side(db):
+    db.record_trade(Trade(strategy="alpha", market_id="1", token_id="t1", side="buy", price=0.5, size=10, reason="a"))
+    db.record_trade(Trade(strategy="alpha", market_id="1", token_id="t1", side="buy", price=0.5, size=5, reason="a"))
+    db.record_trade(Trade(strategy="alpha", market_id="1", token_id="t1", side="sell", price=0.7, size=12, reason="a"))
+    db.record_trade(Trade(strategy="beta", market_id="2", token_id="t2", side="buy", price=0.4, size=4, reason="b"))
+    totals = {(r["strategy"], r["side"]): (r["count"], r["total_size"]) for r in db.get_trade_totals()}
+    assert totals == {("alpha", "buy"): (2, 15.0), ("alpha", "sell"): (1, 12.0), ("beta", "buy"): (1, 4.0)}
+    assert db.get_trade_totals(since="2999-01-01 00:00:00") == []
+
+
 def test_db_context_manager():
     with tempfile.TemporaryDirectory() as tmpdir:
         with Database(Path(tmpdir) / "test.db") as db:
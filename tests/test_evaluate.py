@@ -6,8 +6,9 @@ from pathlib import Path
 
 from typer.testing import CliRunner
 
-from polymarket_agent.cli import _analyze_trades, _build_summary, _build_tunable_params, app
+from polymarket_agent.cli import _build_summary, _build_tunable_params, _merge_trade_totals, _trade_analysis, app
 from polymarket_agent.config import AppConfig
+from polymarket_agent.db import Database, Trade
 
 runner = CliRunner()
 
@@ -219,21 +220,22 @@ def test_build_tunable_params_no_exit_manager_when_disabled() -> None:
     assert "exit_manager.max_hold_hours" not in paths
 
 
-def test_analyze_trades_empty() -> None:
-    result = _analyze_trades([])
+def test_trade_analysis_empty() -> None:
+    result = _trade_analysis(0, 0, 0, 0.0)
     assert result["total"] == 0
     assert result["buys"] == 0
     assert result["sells"] == 0
     assert result["round_trips"] == 0
 
 
-def test_analyze_trades_basic() -> None:
-    trades = [
-        {"side": "buy", "size": "10"},
-        {"side": "buy", "size": "20"},
-        {"side": "sell", "size": "15"},
-    ]
-    result = _analyze_trades(trades)
+def test_trade_analysis_basic() -> None:
+    _by_strategy, buys, sells, total_size = _merge_trade_totals(
+        [
+            {"strategy": "a", "side": "buy", "count": 2, "total_size": 30.0},
+            {"strategy": "a", "side": "sell", "count": 1, "total_size": 15.0},
+        ]
+    )
+    result = _trade_analysis(3, buys, sells, total_size)
     assert result["total"] == 3
     assert result["buys"] == 2
     assert result["sells"] == 1
@@ -241,6 +243,31 @@ def test_analyze_trades_basic() -> None:
     assert result["avg_size"] == 15.0
 
 
+def test_merge_trade_totals_by_strategy() -> None:
+    # Shaped like Database.get_trade_totals rows; SUM(size) is NULL for sizeless trades
+    totals = [
+        {"strategy": "a", "side": "buy", "count": 1, "total_size": 10.0},
+        {"strategy": "a", "side": "sell", "count": 1, "total_size": 12.5},
+        {"strategy": "b", "side": "buy", "count": 1, "total_size": 4.0},
+        {"strategy": "b", "side": "buy", "count": 2, "total_size": None},
+    ]
+    by_strategy, buys, sells, total_size = _merge_trade_totals(totals)
+    assert by_strategy == {"a": {"count": 2, "net": 2.5}, "b": {"count": 3, "net": -4.0}}
+    assert (buys, sells, total_size) == (4, 1, 26.5)
+
+
+def test_merge_trade_totals_from_database(tmp_path: Path) -> None:
+    db = Database(tmp_path / "test.db")
+    for strategy, side, size in (("a", "buy", 10.0), ("a", "sell", 12.5), ("b", "buy", 4.0)):
+        db.record_trade(
+            Trade(strategy=strategy, market_id="m", token_id="t", side=side, price=0.5, size=size, reason="r")
+        )
+    by_strategy, buys, sells, total_size = _merge_trade_totals(db.get_trade_totals())
+    db.close()
+    assert by_strategy == {"a": {"count": 2, "net": 2.5}, "b": {"count": 1, "net": -4.0}}
+    assert (buys, sells, total_size) == (2, 1, 26.5)
+
+
 def test_build_summary_no_trades() -> None:
     class FakeMetrics:
         total_return = 0.0
@@ -303,6 +330,8 @@ def test_evaluate_command_outputs_json(mocker: object, tmp_path: Path) -> None:
     assert "safety_constraints" in output
     assert "summary" in output
     assert output["safety_constraints"]["mode_locked"] is True
+    cfg = AppConfig.model_validate({"mode": "paper", "starting_balance": 1000, "strategies": {}})
+    assert output["current_config"] == json.loads(cfg.model_dump_json())
 
 
 def test_evaluate_command_metrics_structure(mocker: object, tmp_path: Path) -> None:
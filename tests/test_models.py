@@ -1,5 +1,7 @@
 """Tests for Pydantic data models."""
 
+import pytest
+
 from polymarket_agent.data.models import Event, Market, OrderBook, categorize_market
 
 SAMPLE_MARKET_JSON = {
@@ -62,6 +64,13 @@ def test_market_from_cli_json():
     assert market.volume_24h == 10670.252910000008
 
 
+def test_market_question_lower_is_not_a_field():
+    market = Market.from_cli(SAMPLE_MARKET_JSON)
+    assert market.question_lower == "will trump deport less than 250,000?"
+    assert "question_lower" not in market.model_dump()
+    assert market == Market.from_cli(SAMPLE_MARKET_JSON)
+
+
 def test_event_from_cli_json():
     event = Event.from_cli(SAMPLE_EVENT_JSON)
     assert event.id == "16167"
@@ -156,6 +165,21 @@ def test_orderbook_completely_empty():
     assert book.spread == 0.0
 
 
+def test_orderbook_best_prices_ignore_level_order_and_stay_out_of_dumps():
+    """Best prices come from unsorted levels, and the memo is not a model field."""
+    book = OrderBook.from_cli(
+        {
+            "asks": [{"price": "0.62", "size": "1"}, {"price": "0.58", "size": "1"}],
+            "bids": [{"price": "0.50", "size": "1"}, {"price": "0.54", "size": "1"}],
+        }
+    )
+    assert (book.best_ask, book.best_bid) == (0.58, 0.54)
+    assert book.spread == pytest.approx(0.04)
+    assert book.midpoint == pytest.approx(0.56)
+    assert set(book.model_dump()) == {"asks", "bids"}
+    assert book == OrderBook.from_cli(book.model_dump())
+
+
 # ------------------------------------------------------------------
 # Market new fields tests
 # ------------------------------------------------------------------
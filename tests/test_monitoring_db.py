@@ -45,6 +45,23 @@ class TestSignalLog:
         log = db.get_signal_log(limit=3)
         assert len(log) == 3
 
+    def test_since_id(self, db: Database) -> None:
+        for strategy in ("a", "b", "a"):
+            db.record_signal(strategy=strategy, market_id="m", token_id="t", side="buy", confidence=0.5, size=1.0)
+        assert [row["id"] for row in db.get_signal_log(since_id=1)] == [3, 2]
+        assert [row["id"] for row in db.get_signal_log(strategy="a", since_id=1)] == [3]
+        assert db.get_signal_log(since_id=3) == []
+
+    def test_signal_counts(self, db: Database) -> None:
+        for strategy in ("a", "b", "a", "c"):
+            db.record_signal(strategy=strategy, market_id="m", token_id="t", side="buy", confidence=0.5, size=1.0)
+        assert db.get_signal_counts() == [
+            {"strategy": "c", "count": 1},
+            {"strategy": "a", "count": 2},
+            {"strategy": "b", "count": 1},
+        ]
+        assert db.get_signal_counts(limit=2) == [{"strategy": "c", "count": 1}, {"strategy": "a", "count": 1}]
+
     def test_custom_status(self, db: Database) -> None:
         db.record_signal(
             strategy="test",
@@ -86,3 +103,51 @@ class TestPortfolioSnapshots:
         # Most recent first
         assert snaps[0]["balance"] == 200.0
         assert snaps[1]["balance"] == 100.0
+
+    def test_ascending_order_keeps_most_recent_window(self, db: Database) -> None:
+        for i in range(5):
+            db.record_portfolio_snapshot(balance=float(i), total_value=float(i))
+        snaps = db.get_portfolio_snapshots(limit=3, order="asc")
+        assert [s["balance"] for s in snaps] == [2.0, 3.0, 4.0]
+
+    def test_since_id_returns_only_newer_snapshots(self, db: Database) -> None:
+        for i in range(4):
+            db.record_portfolio_snapshot(balance=float(i), total_value=float(i))
+        assert [s["id"] for s in db.get_portfolio_snapshots(since_id=2)] == [4, 3]
+        assert [s["id"] for s in db.get_portfolio_snapshots(since_id=2, limit=1, order="asc")] == [4]
+        assert db.get_portfolio_snapshots(since_id=4) == []
+
+    def test_since_filters_by_timestamp_not_id(self, db: Database) -> None:
+        for i, ts in enumerate(["2024-01-02 00:00:00", "2024-01-01 00:00:00", "2024-01-03 00:00:00"]):
+            db.record_portfolio_snapshot(balance=float(i), total_value=float(i))
+            db._conn.execute("UPDATE portfolio_snapshots SET timestamp = ? WHERE id = ?", (ts, i + 1))
+        snaps = db.get_portfolio_snapshots(since="2024-01-02 00:00:00")
+        assert [s["balance"] for s in snaps] == [2.0, 0.0]
+        assert db.get_portfolio_snapshots(since="2024-01-04 00:00:00") == []
+
+    def test_rows_read_across_a_concurrent_write_are_not_cached_as_fresh(self, db: Database) -> None:
+        db.record_portfolio_snapshot(balance=1.0, total_value=1.0)
+        conn = db._conn
+
+        class _RowsBeforeWrite:
+            """Return the query's rows, then let another "thread" write and re-read before they are cached."""
+
+            def __init__(self) -> None:
+                self.pending = True
+
+            def __getattr__(self, name: str) -> object:
+                return getattr(conn, name)
+
+            def execute(self, sql: str, *args: object) -> object:
+                cursor = conn.execute(sql, *args)
+                if not (self.pending and "FROM portfolio_snapshots" in sql):
+                    return cursor
+                self.pending = False
+                rows = cursor.fetchall()
+                db.record_portfolio_snapshot(balance=2.0, total_value=2.0)
+                assert len(db.get_portfolio_snapshots()) == 2
+                return type("Rows", (), {"fetchall": lambda _: rows})()
+
+        db._conn = _RowsBeforeWrite()  # type: ignore[assignment]
+        assert len(db.get_portfolio_snapshots()) == 1
+        assert len(db.get_portfolio_snapshots()) == 2